@@ -0,0 +1,38 @@
+"""
+generation time and output size of the remark backend (markdown parsed by remark.js in the browser)
+against the html backend (every slide rendered to html while the deck is built)
+run with: python benchmarks/backends.py [--sections 300]
+"""
+from autoslides.deck import writeDeck
+from autoslides.sink import SINKS
+from corpus import corpus, DEFAULT_MIX
+import argparse
+import gzip
+import time
+
+
+def built(markdown:str, backend:str) -> tuple:
+    start = time.perf_counter()
+    out = SINKS[backend]()
+    writeDeck(out, markdown.splitlines(keepends = True), "benchmark")
+    deck = out.getvalue()
+    return time.perf_counter() - start, deck
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type = int, nargs = "+", default = [100, 300])
+    parser.add_argument("--repeat", type = int, default = 3, help = "builds per backend, the fastest is reported")
+    args = parser.parse_args()
+
+    print(f"{'sections':>8} {'backend':>8} {'slides':>7} {'seconds':>8} {'bytes':>10} {'gzip bytes':>11}")
+    for sections in args.sections:
+        markdown = corpus(sections, DEFAULT_MIX, seed = 0)
+        for backend in SINKS:
+            runs = [built(markdown, backend) for _ in range(args.repeat)]
+            seconds = min(run[0] for run in runs)
+            deck = runs[0][1].encode()
+            slides = deck.count(b"<section") if backend == "html" else deck.count(b"\n---\n")
+            print(f"{sections:8} {backend:>8} {slides:7} {seconds:8.3f} {len(deck):10} {len(gzip.compress(deck)):11}")
+
+if __name__ == "__main__":
+    main()
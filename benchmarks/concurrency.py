@@ -0,0 +1,60 @@
+"""
+concurrency stress test of the library api,
+converts synthetic documents (see corpus.py) from a thread pool and checks that every deck
+is identical to the one converted serially, with and without a shared SectionCache
+run with: python benchmarks/concurrency.py [--threads 16] [--rounds 20]
+"""
+from autoslides import convert, convert_stream
+from autoslides.cache import SectionCache
+from concurrent.futures import ThreadPoolExecutor
+from corpus import corpus, DEFAULT_MIX
+import argparse
+import io
+import sys
+import time
+
+DOCUMENTS = 8
+
+
+def streamed(markdown:str, **options) -> str:
+    output = io.StringIO()
+    convert_stream(io.StringIO(markdown), output, **options)
+    return output.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type = int, default = 16)
+    parser.add_argument("--rounds", type = int, default = 20, help = "conversions of every document per variant")
+    parser.add_argument("--sections", type = int, default = 20, help = "heading sections per document")
+    args = parser.parse_args()
+
+    documents = [corpus(args.sections, DEFAULT_MIX, seed) for seed in range(DOCUMENTS)]
+    variants = {
+        "convert": (convert, {}),
+        "verbose": (convert, {"verbose": True}),
+        "layout": (convert, {"lines": 5, "line_width": 60}),
+        "stream": (streamed, {}),
+    }
+    expected = {(name, i): function(document, **options)
+                for name, (function, options) in variants.items() for i, document in enumerate(documents)}
+    cache = SectionCache(maxBytes = 256 * 1024)
+    jobs = [(name, i) for _ in range(args.rounds) for name in variants for i in range(DOCUMENTS)]
+
+    def run(job:tuple) -> bool:
+        name, i = job
+        function, options = variants[name]
+        if name != "stream" and i % 2 == 0:
+            options = {**options, "cache": cache} #half of the jobs share one small, constantly evicting cache
+        return function(documents[i], **options) == expected[job]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as executor:
+        results = list(executor.map(run, jobs))
+    seconds = time.perf_counter() - start
+    mismatches = results.count(False)
+    print(f"{len(jobs)} conversions on {args.threads} threads in {seconds:.2f}s, {mismatches} differed from the serial output")
+    if mismatches > 0:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+deterministic generator of synthetic markdown corpora for the benchmarks
+the same size, mix and seed always produce the same document
+"""
+import random
+
+DEFAULT_MIX = {
+    "paragraph": 5,
+    "list": 3,
+    "code": 2,
+    "math": 2,
+    "table": 1,
+    "image": 1,
+}
+
+WORDS = ("slide", "graph", "vertex", "edge", "weight", "path", "tree", "node", "cost", "order",
+         "search", "queue", "stack", "heap", "sort", "merge", "split", "bound", "proof", "lemma")
+
+
+def sentence(rng:random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(4, 18))]
+    emphasis = rng.random()
+    if emphasis < 0.2:
+        words[0] = f"**{words[0]}**"
+    elif emphasis < 0.4:
+        words[-1] = f"*{words[-1]}*"
+    elif emphasis < 0.5:
+        words.insert(rng.randint(0, len(words)), f"$x_{rng.randint(0, 9)} + y$")
+    return " ".join(words).capitalize() + "."
+
+def paragraph(rng:random.Random) -> str:
+    return " ".join(sentence(rng) for _ in range(rng.randint(2, 8))) + "\n"
+
+def nestedList(rng:random.Random) -> str:
+    lines = []
+    level = 0
+    for i in range(rng.randint(3, 15)):
+        lines.append(f"{'  ' * level}- {sentence(rng)}")
+        level = max(0, min(level + rng.choice((-1, 0, 1)), 4))
+    return "\n".join(lines) + "\n"
+
+def codeFence(rng:random.Random) -> str:
+    lines = [f"    total = total + item{i} * {rng.randint(1, 99)}" for i in range(rng.randint(3, 30))]
+    return "```python\ndef accumulate(items):\n    total = 0\n" + "\n".join(lines) + "\n    return total\n```\n"
+
+def mathBlock(rng:random.Random) -> str:
+    lines = []
+    for i in range(rng.randint(2, 8)):
+        if rng.random() < 0.4:
+            lines.append(f"A_{i} &= \\begin{{bmatrix}} {i} & 1 \\\\ 0 & {i} \\end{{bmatrix}}")
+        else:
+            lines.append(f"x_{i} &= x_{i - 1} + {rng.randint(1, 9)}")
+    return "$$\n\\begin{aligned}\n" + " \\\\\n".join(lines) + "\n\\end{aligned}\n$$\n"
+
+def table(rng:random.Random) -> str:
+    rows = [f"| {i} | {rng.choice(WORDS)} | {rng.randint(0, 999)} |" for i in range(rng.randint(2, 25))]
+    return "| id | name | value |\n|:---|:----:|----:|\n" + "\n".join(rows) + "\n"
+
+def image(rng:random.Random) -> str:
+    return f"![{rng.choice(WORDS)} diagram](images/{rng.choice(WORDS)}{rng.randint(0, 99)}.png)\n"
+
+GENERATORS = {
+    "paragraph": paragraph,
+    "list": nestedList,
+    "code": codeFence,
+    "math": mathBlock,
+    "table": table,
+    "image": image,
+}
+
+def corpus(sections:int, mix:dict = DEFAULT_MIX, seed = 0, blocksPerSection = 6) -> str:
+    """
+    a markdown document with the given number of heading sections,
+    the blocks of every section are drawn from mix (block kind -> relative weight)
+    """
+    rng = random.Random(seed)
+    kinds = list(mix.keys())
+    weights = list(mix.values())
+    parts = ["---\ntitle: Synthetic Corpus\n---\n\n"]
+    for i in range(sections):
+        parts.append(f"{'#' * rng.choice((1, 2, 2, 3))} Section {i}\n\n")
+        for kind in rng.choices(kinds, weights, k = blocksPerSection):
+            parts.append(GENERATORS[kind](rng))
+            parts.append("\n")
+    return "".join(parts)
@@ -0,0 +1,50 @@
+"""
+stress test for deeply nested outlines: 10k items nested up to 50 levels deep
+times block construction, rendering and pagination of the list
+run with: python benchmarks/lists.py
+"""
+from autoslides.block import asBlock
+from autoslides.head import Head
+from mistletoe import Document
+import sys
+import time
+
+ITEMS = 10000
+DEPTH = 50
+
+
+def nestedOutline(items:int, depth:int) -> str:
+    """
+    an outline that walks down to depth and back up again, over and over
+    """
+    lines = []
+    level = 0
+    step = 1
+    for i in range(items):
+        lines.append(f"{'  ' * level}- item {i} at level {level}")
+        if level + step < 0 or level + step >= depth:
+            step = -step
+        level += step
+    return "\n".join(lines) + "\n"
+
+def timed(function) -> tuple:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def main():
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20 * DEPTH)) #mistletoe parses nested lists recursively
+    document = Document(f"# Outline\n\n{nestedOutline(ITEMS, DEPTH)}")
+    head = Head(document.children[0])
+    block, buildTime = timed(lambda: asBlock(document.children[1]))
+    markdown, strTime = timed(lambda: str(block))
+    markdown, reusedStrTime = timed(lambda: str(block))
+    slides, slidesTime = timed(lambda: block.slides(head))
+    print(f"{ITEMS} items, {DEPTH} levels deep")
+    print(f"  asBlock   {buildTime * 1000:9.2f}ms")
+    print(f"  str       {strTime * 1000:9.2f}ms ({len(markdown)} characters)")
+    print(f"  str again {reusedStrTime * 1000:9.2f}ms (reuses the flattened index)")
+    print(f"  slides    {slidesTime * 1000:9.2f}ms ({len(slides)} slides)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+memory use of the block and component layer on a synthetic corpus (see corpus.py), measured with tracemalloc
+retained: what the blocks of every section keep alive once they are built and the parse trees are dropped
+peak: the largest traced allocation while a complete deck is converted
+run with: python benchmarks/memory.py [--sections 300]
+"""
+from autoslides.mdPreprocess import preprocessedLines
+from autoslides.section import splitSections
+from autoslides.block import asBlock
+from autoslides.component import parsedDocument
+from autoslides.head import Head
+from autoslides.deck import writeDeck
+from autoslides.sink import OutputSink
+from mistletoe.block_token import Heading
+from corpus import corpus, DEFAULT_MIX
+import argparse
+import gc
+import os
+import tracemalloc
+
+
+def builtBlocks(sections:list) -> list:
+    blocks = []
+    for section in sections:
+        for child in parsedDocument(section).children:
+            blocks.append(Head(child) if isinstance(child, Heading) else asBlock(child, verbose = True))
+    return blocks
+
+def retainedBytes(sections:list) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    blocks = builtBlocks(sections)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained, len(blocks)
+
+def peakBytes(markdown:str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    with open(os.devnull, "w") as devnull:
+        out = OutputSink(devnull)
+        writeDeck(out, markdown.splitlines(keepends = True), "benchmark")
+        out.close()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type = int, nargs = "+", default = [100, 300])
+    args = parser.parse_args()
+
+    print(f"{'sections':>8} {'source bytes':>13} {'blocks':>7} {'retained bytes':>15} {'peak bytes':>11}")
+    for sections in args.sections:
+        markdown = corpus(sections, DEFAULT_MIX, seed = 0)
+        sectionSources = list(splitSections(preprocessedLines(markdown.splitlines(keepends = True), {})))
+        retained, blocks = retainedBytes(sectionSources)
+        print(f"{sections:8} {len(markdown):13} {blocks:7} {retained:15} {peakBytes(markdown):11}")
+
+if __name__ == "__main__":
+    main()
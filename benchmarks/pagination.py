@@ -0,0 +1,47 @@
+"""
+pagination cost of long code fences and big tables for every pagination engine,
+the time per component should stay flat as the number of components grows
+run with: python benchmarks/pagination.py
+"""
+from autoslides.block import asBlock
+from autoslides.head import Head
+from autoslides.paginate import PAGINATORS
+from mistletoe import Document
+import time
+
+SIZES = [10000, 20000, 40000, 80000]
+
+
+def codeFence(size:int) -> str:
+    lines = "\n".join(f"value{i} = compute(value{i - 1}, {i})" for i in range(size))
+    return f"```python\n{lines}\n```\n"
+
+def table(size:int) -> str:
+    rows = "\n".join(f"| {i} | cell {i} | **{i * 2}** |" for i in range(size))
+    return f"| a | b | c |\n|---|---|---|\n{rows}\n"
+
+def wrappedParagraph(size:int) -> str:
+    """
+    sentences of varying length, so slides do not fill up evenly
+    """
+    return " ".join(f"Sentence {i} {'is long ' * (i % 23)}." for i in range(size)) + "\n"
+
+def timedPagination(markdown:str, paginator:str) -> tuple:
+    document = Document(f"# Benchmark\n\n{markdown}")
+    head = Head(document.children[0])
+    block = asBlock(document.children[1])
+    block.layout()
+    start = time.perf_counter()
+    slides = block.slides(head, paginator = paginator)
+    return time.perf_counter() - start, len(slides)
+
+def main():
+    for name, generator in (("code fence", codeFence), ("table", table), ("paragraph", wrappedParagraph)):
+        for size in SIZES:
+            markdown = generator(size)
+            for paginator in PAGINATORS:
+                seconds, slideCount = timedPagination(markdown, paginator)
+                print(f"{name:10} {paginator:8} {size:7} components {slideCount:6} slides {seconds * 1000:9.2f}ms {seconds / size * 1e6:6.2f}us/component")
+
+if __name__ == "__main__":
+    main()
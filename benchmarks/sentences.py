@@ -0,0 +1,54 @@
+"""
+sentence splitting of math heavy paragraphs with hundreds of inline formulas,
+compares the single pass scanner against the previous placeholder based splitter
+run with: python benchmarks/sentences.py
+"""
+from autoslides.utils import delimitedTextToken, SentenceDelimiter
+from mistletoe.span_token import RawText
+import re
+import timeit
+
+FORMULAS = [100, 200, 400, 800]
+
+
+def placeholderDelimitedTextToken(textToken:RawText) -> list:
+    """
+    the previous implementation, kept here as the baseline
+    """
+    pattern = re.compile(r'\$.*?\$')
+    inlineMathParts = re.findall(pattern, textToken.content)
+    rawTextContent = pattern.sub('$inlineMath$', textToken.content)
+    cumulativeTokenList = []
+    tokens = rawTextContent.split('. ')
+    for token in tokens[:-1]:
+        cumulativeTokenList += [RawText(f'{token}.'), SentenceDelimiter()]
+    if tokens[-1] != '':
+        cumulativeTokenList.append(RawText(tokens[-1]))
+    i = 0
+    while i < len(inlineMathParts):
+        for token in cumulativeTokenList:
+            for j in range(token.content.count('$inlineMath$')):
+                token.content = token.content.replace('$inlineMath$', inlineMathParts[i] ,1)
+                i += 1
+    return cumulativeTokenList
+
+def mathParagraph(formulas:int) -> str:
+    return " ".join(f"Here $x^{i} + y. z$ holds and $a + {i}$ too. " for i in range(formulas // 2))
+
+def mathSentence(formulas:int) -> str:
+    """
+    one long sentence, every formula restored by the placeholder splitter rescans it
+    """
+    return " and ".join(f"$x_{i} = {i}. y$" for i in range(formulas)) + ". Done"
+
+def main():
+    for name, generator in (("paragraph", mathParagraph), ("sentence", mathSentence)):
+        for formulas in FORMULAS:
+            text = generator(formulas)
+            repeat = 20
+            previous = timeit.timeit(lambda: placeholderDelimitedTextToken(RawText(text)), number = repeat) / repeat
+            current = timeit.timeit(lambda: delimitedTextToken(RawText(text)), number = repeat) / repeat
+            print(f"{name:9} {formulas:5} formulas  placeholder {previous * 1000:8.2f}ms  single pass {current * 1000:8.2f}ms  {previous / current:6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+allocation of writing decks with tens of thousands of slides,
+compares building every block's slides as concatenated strings against writing them into an OutputSink
+run with: python benchmarks/sink.py
+"""
+from autoslides.block import asBlock
+from autoslides.head import Head
+from autoslides.sink import OutputSink
+from mistletoe import Document
+import os
+import time
+import tracemalloc
+
+SLIDES = [10000, 40000]
+
+
+def concatenatedSlides(block, head) -> str:
+    """
+    the previous approach: every slide is a string, the sub deck is grown with +=
+    """
+    subDeck = ""
+    for slide in block.slides(head):
+        subDeck += f"{slide}\n"
+        subDeck += "\n---\n\n"
+    return subDeck
+
+def measured(function) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+def main():
+    for slides in SLIDES:
+        code = "\n".join(f"print({i})" for i in range(slides * 8))
+        document = Document(f"# Deck\n\n```python\n{code}\n```\n")
+        head = Head(document.children[0])
+        block = asBlock(document.children[1])
+        block.layout()
+        with open(os.devnull, "w") as devnull:
+            concatenated = measured(lambda: devnull.write(concatenatedSlides(block, head)))
+            sink = OutputSink(devnull)
+            streamed = measured(lambda: block.writeSlides(sink, head))
+            sink.close()
+        for name, (seconds, peak) in (("concatenated", concatenated), ("output sink", streamed)):
+            print(f"{slides:6} slides  {name:12} {seconds * 1000:9.2f}ms  peak {peak / 1024 / 1024:8.2f}MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+end to end benchmark suite over synthetic corpora (see corpus.py)
+every stage of the conversion is timed separately and the results are printed as JSON,
+so runs of different commits can be compared
+with --check the run fails if any stage grows super-linearly with the input size
+run with: python benchmarks/suite.py [--sizes 50 200 800] [--output results.json] [--check]
+"""
+from autoslides.mdPreprocess import preprocessedLines
+from autoslides.section import splitSections
+from autoslides.block import asBlock, CompositeBlock
+from autoslides.head import Head
+from autoslides.sink import OutputSink
+from autoslides.paginate import PAGINATORS
+from autoslides.args import LINES, LINEWIDTH, PAGINATOR
+from autoslides import main as autoslidesMain
+from mistletoe import Document
+from mistletoe.block_token import Heading
+from corpus import corpus, DEFAULT_MIX
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+STAGES = ["preprocess", "split", "parse", "asBlock", "pagination", "write", "main"]
+
+
+def stageTimings(markdown:str, sourcePath:str, outputPath:str) -> dict:
+    """
+    runs the conversion pipeline stage by stage and returns the seconds spent in each
+    """
+    timings = {}
+    start = time.perf_counter()
+    processedLines = list(preprocessedLines(markdown.splitlines(keepends = True), {}))
+    timings["preprocess"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    definitions = []
+    sections = list(splitSections(processedLines, definitions))
+    timings["split"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    documents = [Document(section) for section in sections]
+    timings["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    blocks = []
+    for document in documents:
+        currentHead = None
+        for child in document.children:
+            if isinstance(child, Heading):
+                currentHead = Head(child)
+                blocks.append((currentHead, None))
+            else:
+                blocks.append((currentHead, asBlock(child, verbose = False)))
+    timings["asBlock"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for head, block in blocks:
+        if isinstance(block, CompositeBlock):
+            PAGINATORS[PAGINATOR](block.layout(LINEWIDTH), LINES)
+    timings["pagination"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        out = OutputSink(devnull)
+        for head, block in blocks:
+            if block is None:
+                if head.level() < 4:
+                    head.writeSlides(out)
+            else:
+                block.writeSlides(out, head)
+        out.close()
+    timings["write"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    arguments = sys.argv
+    sys.argv = ["autoslides", "--no-server", sourcePath, outputPath] #a running autoslides serve would be timed instead
+    try:
+        autoslidesMain.main()
+    finally:
+        sys.argv = arguments
+    timings["main"] = time.perf_counter() - start
+    return timings
+
+def bestTimings(sections:int, seed:int, repeat:int, directory:str) -> dict:
+    markdown = corpus(sections, DEFAULT_MIX, seed)
+    sourcePath = os.path.join(directory, f"corpus{sections}.md")
+    with open(sourcePath, "w") as source:
+        source.write(markdown)
+    runs = [stageTimings(markdown, sourcePath, os.path.join(directory, "deck.html")) for _ in range(repeat)]
+    return {
+        "sections": sections,
+        "bytes": len(markdown.encode()),
+        "stages": {stage: min(run[stage] for run in runs) for stage in STAGES},
+    }
+
+def growthExponents(results:list) -> dict:
+    """
+    the exponent k of time ~ size^k between the smallest and largest input, per stage
+    """
+    smallest, largest = results[0], results[-1]
+    sizeRatio = largest["bytes"] / smallest["bytes"]
+    exponents = {}
+    for stage in STAGES:
+        timeRatio = largest["stages"][stage] / max(smallest["stages"][stage], 1e-9)
+        exponents[stage] = math.log(timeRatio) / math.log(sizeRatio)
+    return exponents
+
+def commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output = True, text = True, check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [50, 200, 800], help = "corpus sizes in heading sections")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--repeat", type = int, default = 3, help = "runs per size, the fastest run is reported")
+    parser.add_argument("--output", type = str, help = "write the JSON results to this file instead of stdout")
+    parser.add_argument("--check", action = "store_true", help = "fail if a stage grows super-linearly")
+    parser.add_argument("--max-exponent", type = float, default = 1.3, help = "largest growth exponent accepted by --check")
+    parser.add_argument("--min-seconds", type = float, default = 0.005, help = "stages faster than this on the largest input are not checked")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [bestTimings(sections, args.seed, args.repeat, directory) for sections in sorted(args.sizes)]
+    exponents = growthExponents(results) if len(results) > 1 else {}
+    report = {
+        "commit": commit(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "mix": DEFAULT_MIX,
+        "results": results,
+        "growthExponents": exponents,
+    }
+    if args.output is not None:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent = 2)
+    else:
+        json.dump(report, sys.stdout, indent = 2)
+        print()
+
+    if args.check:
+        superLinear = [stage for stage, exponent in exponents.items()
+                       if exponent > args.max_exponent and results[-1]["stages"][stage] >= args.min_seconds]
+        for stage in superLinear:
+            print(f"{stage} grows super-linearly (exponent {exponents[stage]:.2f})", file = sys.stderr)
+        if len(superLinear) > 0:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+time to build and paginate big tables, written as a markdown table and as a csv fence (see autoslides.table)
+build: parsing the markdown and building the block, slides: measuring the rows and writing every slide
+run with: python benchmarks/tables.py [--rows 10000 50000]
+"""
+from autoslides.block import asBlock
+from autoslides.component import parsedDocument
+from autoslides.head import Head
+from autoslides.sink import OutputSink
+import argparse
+import time
+
+
+def markdownTable(rows:int) -> str:
+    lines = "\n".join(f"| {i} | customer {i} | **{i * 2}** | region {i % 7} |" for i in range(rows))
+    return f"| id | name | total | region |\n|---|---|---|---|\n{lines}\n"
+
+def csvFence(rows:int) -> str:
+    lines = "\n".join(f"{i},customer {i},**{i * 2}**,region {i % 7}" for i in range(rows))
+    return f"```csv\nid,name,total,region\n{lines}\n```\n"
+
+def timedTable(markdown:str) -> tuple:
+    start = time.perf_counter()
+    document = parsedDocument(f"# Benchmark\n\n{markdown}")
+    head = Head(document.children[0])
+    block = asBlock(document.children[1])
+    built = time.perf_counter()
+    out = OutputSink()
+    block.writeSlides(out, head)
+    return built - start, time.perf_counter() - built, out.getvalue().count("\n---\n")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type = int, nargs = "+", default = [10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'table':8} {'rows':>7} {'build':>10} {'slides':>10} {'slide count':>12}")
+    for rows in args.rows:
+        for name, generator in (("markdown", markdownTable), ("csv", csvFence)):
+            build, slides, slideCount = timedTable(generator(rows))
+            print(f"{name:8} {rows:7} {build * 1000:8.1f}ms {slides * 1000:8.1f}ms {slideCount:12}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+line splitting of large derivation blocks with many matrices,
+compares the single pass TeX splitter against the previous extract and restore splitter
+run with: python benchmarks/texlines.py
+"""
+from autoslides.utils import splitTexLines
+import re
+import timeit
+from string import Template
+
+LINES = [100, 400, 1600, 6400]
+
+
+def extractAndRestoreLines(jointLines:str) -> list:
+    """
+    the previous implementation, kept here as the baseline
+    """
+    multilineEnvironments = ["bmatrix","matrix"]
+    extractedBlocks = {}
+    for env in multilineEnvironments:
+        pattern = re.compile(Template(r'\\begin{$env}.*?\\end{$env}').substitute(env=env))
+        extractedBlocks[env] = pattern.findall(jointLines)
+        jointLines = re.sub(pattern, f'$${env}$$', jointLines)
+    jointLines = jointLines.replace("\\\\", "$$nl$$")
+    for env in multilineEnvironments:
+        for block in extractedBlocks[env]:
+            jointLines = jointLines.replace(f"$${env}$$", block, 1)
+    return jointLines.split("$$nl$$")
+
+def derivation(lines:int) -> str:
+    return " \\\\\n".join(f"x_{{{i}}} &= \\begin{{bmatrix}} {i} & 0 \\\\ 0 & {i} \\end{{bmatrix}} y_{{{i}}}" for i in range(lines))
+
+def main():
+    for lines in LINES:
+        tex = derivation(lines)
+        assert splitTexLines(tex) == extractAndRestoreLines(tex)
+        repeat = 5
+        previous = timeit.timeit(lambda: extractAndRestoreLines(tex), number = repeat) / repeat
+        current = timeit.timeit(lambda: splitTexLines(tex), number = repeat) / repeat
+        print(f"{lines:6} lines  extract and restore {previous * 1000:9.2f}ms  single pass {current * 1000:8.2f}ms  {previous / current:6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+def __getattr__(name:str):
+    """
+    the library api is imported on first use so the cli does not pay for it
+    """
+    if name in ("convert", "convert_stream"):
+        from autoslides import api
+        return getattr(api, name)
+    raise AttributeError(f"module 'autoslides' has no attribute '{name}'")
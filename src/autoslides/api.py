@@ -0,0 +1,27 @@
+from autoslides.deck import writeDeck
+from autoslides.sink import SINKS
+from autoslides.args import LINES, LINEWIDTH, PAGINATOR, BACKEND
+
+DEFAULT_TITLE = "Slides"
+
+
+def convert(markdown:str, *, verbose = False, lines = LINES, line_width = LINEWIDTH, paginator = PAGINATOR, title = DEFAULT_TITLE, cache = None, backend = BACKEND) -> str:
+    """
+    converts a markdown document into a complete html deck and returns it
+    safe to call concurrently from several threads, a frontmatter title replaces title
+    """
+    out = SINKS[backend]()
+    writeDeck(out, markdown.splitlines(keepends = True), title, verbose = verbose, lines = lines, lineWidth = line_width, paginator = paginator, cache = cache)
+    return out.getvalue()
+
+def convert_stream(source, output, *, verbose = False, lines = LINES, line_width = LINEWIDTH, paginator = PAGINATOR, title = DEFAULT_TITLE, cache = None, backend = BACKEND):
+    """
+    converts markdown read one line at a time from source (a text file or any iterable of lines)
+    and writes the deck into the text stream output, one heading section at a time
+    like --stream, reference style links only resolve to definitions that appear before them
+    """
+    if isinstance(source, str):
+        source = source.splitlines(keepends = True)
+    out = SINKS[backend](output)
+    writeDeck(out, source, title, stream = True, verbose = verbose, lines = lines, lineWidth = line_width, paginator = paginator, cache = cache)
+    out.flush()
@@ -1,2 +1,8 @@
 LINES = 8
 LINEWIDTH = 100
+PAGINATOR = "greedy"
+BACKEND = "remark"
+HIGHLIGHT_CLASS = "highlight"
+HIGHLIGHT_THEME = "default"
+MULTILINE_ENVIRONMENTS = ["matrix", "bmatrix", "pmatrix", "Bmatrix", "vmatrix", "Vmatrix", "smallmatrix",
+                          "cases", "array", "subarray", "aligned", "gathered", "split"]
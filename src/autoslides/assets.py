@@ -0,0 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+from mistletoe.span_token import Image
+from pathlib import Path
+from urllib.parse import unquote
+import hashlib
+import os
+import re
+import shutil
+import threading
+
+try:
+    from PIL import Image as PILImage
+except ImportError: #downscaling is optional, images are copied unchanged without Pillow
+    PILImage = None
+
+DEFAULT_ASSETS_DIR = "assets"
+REMOTE_SOURCE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:|//") #urls and data uris are left as they are
+IMAGE_SOURCE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)")
+DEFINITION_TARGET = re.compile(r"^ {0,3}\[[^\]]+\]:\s*<?([^\s>]+)", re.MULTILINE) #reference style images
+ASSET_NAME = re.compile(r"[0-9a-f]{16}(?:-\d+)?\.?\w*")
+
+
+def imageTokens(token) -> list:
+    """
+    every Image span token inside a parsed document, image blocks and inline images alike
+    """
+    images = []
+    stack = [token]
+    while len(stack) > 0:
+        token = stack.pop()
+        if isinstance(token, Image):
+            images.append(token)
+        header = getattr(token, "header", None) #the header row of a table is not one of its children
+        if header is not None:
+            stack.append(header)
+        children = getattr(token, "children", None)
+        if children is not None:
+            stack.extend(children)
+    return images
+
+def downscaledCopy(source:Path, target:Path, maxSize:int):
+    try:
+        image = PILImage.open(source)
+    except OSError: #not a raster image Pillow can read (svg for example)
+        shutil.copyfile(source, target)
+        return
+    with image:
+        if max(image.size) <= maxSize:
+            shutil.copyfile(source, target)
+            return
+        imageFormat = image.format
+        image.thumbnail((maxSize, maxSize))
+        image.save(target, format = imageFormat)
+
+
+class AssetStore:
+    """
+    copies the images referenced by a deck into directory under content hash names,
+    so repeated images are stored once and the files of earlier builds are reused
+    copies run in a thread pool, every source file is hashed at most once per store
+    url is how the deck refers to directory, relative image paths are resolved against sourceDirectory
+    """
+
+    def __init__(self, directory, url = DEFAULT_ASSETS_DIR, sourceDirectory = ".", maxSize = None, workers = None):
+        self.__directory = Path(directory)
+        self.__url = url
+        self.__sourceDirectory = Path(sourceDirectory)
+        self.__maxSize = maxSize if PILImage is not None else None
+        self.__executor = ThreadPoolExecutor(workers)
+        self.__assets = {} #resolved source path -> Future of the asset url
+        self.__lock = threading.Lock()
+        self.__directory.mkdir(parents = True, exist_ok = True)
+
+    def key(self) -> tuple:
+        """
+        everything about the store that changes the rendered slides, for section cache keys
+        """
+        return str(self.__directory.resolve()), self.__url, str(self.__sourceDirectory.resolve()), self.__maxSize
+
+    def stamps(self, markdown:str) -> tuple:
+        """
+        the size and modification time of the local images markdown refers to, for section cache keys
+        so that a section is rendered (and its images copied) again once one of its images changes
+        """
+        stamps = []
+        for src in IMAGE_SOURCE.findall(markdown) + DEFINITION_TARGET.findall(markdown):
+            if REMOTE_SOURCE.match(src):
+                continue
+            try:
+                status = os.stat(self.__sourceDirectory / unquote(src))
+                stamps.append((src, status.st_mtime_ns, status.st_size))
+            except OSError:
+                stamps.append((src, None, None))
+        return tuple(stamps)
+
+    def copiesExist(self, slides:str) -> bool:
+        """
+        whether every copy rendered slides refer to is still in the directory
+        """
+        prefix = f"{self.__url}/"
+        for match in re.finditer(re.escape(prefix) + f"({ASSET_NAME.pattern})", slides):
+            if not (self.__directory / match.group(1)).exists():
+                return False
+        return True
+
+    def asset(self, src:str):
+        """
+        a Future of the url of the copied image, None for remote images
+        """
+        if REMOTE_SOURCE.match(src):
+            return None
+        path = (self.__sourceDirectory / unquote(src)).resolve()
+        with self.__lock:
+            if path not in self.__assets:
+                self.__assets[path] = self.__executor.submit(self.__copy, path)
+            return self.__assets[path]
+
+    def __copy(self, source:Path) -> str:
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+        size = "" if self.__maxSize is None else f"-{self.__maxSize}"
+        name = f"{digest}{size}{source.suffix.lower()}"
+        target = self.__directory / name
+        if not target.exists():
+            temporaryTarget = self.__directory / f"{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            if self.__maxSize is None:
+                shutil.copyfile(source, temporaryTarget)
+            else:
+                downscaledCopy(source, temporaryTarget, self.__maxSize)
+            os.replace(temporaryTarget, target)
+        return f"{self.__url}/{name}"
+
+    def rewrite(self, document):
+        """
+        points the images of a parsed document to their copies,
+        all copies are started before waiting on any of them
+        images that cannot be read keep their original src
+        """
+        pending = [(token, self.asset(token.src)) for token in imageTokens(document)]
+        for token, asset in pending:
+            if asset is None:
+                continue
+            try:
+                token.src = asset.result()
+            except OSError:
+                pass
+
+    def close(self):
+        self.__executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
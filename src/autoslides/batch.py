@@ -0,0 +1,134 @@
+from autoslides.deck import TEMPLATES, templates, writeDeck
+from autoslides.sink import openSink
+from autoslides.manifest import MANIFEST_NAME, loadManifest, saveManifest, inputRecords, sameContent, referencedFiles, includedFiles
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata, resources
+from pathlib import Path
+import argparse
+import os
+import time
+
+
+def markdownSources(sourceDir:Path) -> list:
+    """
+    finds every markdown file inside a directory tree, in a stable order
+    """
+    return sorted(path for path in sourceDir.rglob("*.md") if path.is_file())
+
+def outputPath(source:Path, sourceDir:Path, outputDir:Path) -> Path:
+    return Path(outputDir, os.path.splitext(os.path.relpath(source, sourceDir))[0] + ".html")
+
+def buildFile(source:str, output:str, title:str, verbose = False, allowIncludes = False) -> tuple:
+    """
+    converts a single markdown file, this runs inside a pool worker
+    with allowIncludes csv and tsv fences can include files from the directory of the source
+    failures are returned instead of raised so that one bad file does not stop the batch
+    """
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(output) or ".", exist_ok = True)
+        with open(source, "r") as file, openSink(output) as outputSink:
+            writeDeck(outputSink, file, title, verbose = verbose, includeDirectory = os.path.dirname(source) or "." if allowIncludes else None)
+        error = None
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+        if os.path.exists(output):
+            os.remove(output) #do not leave a partial deck behind
+    return source, time.perf_counter() - start, error
+
+def sharedInputs(sourceDir:Path, includes:list) -> list:
+    """
+    the files every deck depends on: the templates, the stylesheets and the --include paths
+    """
+    package = resources.files("autoslides")
+    paths = [package.joinpath(name) for name in TEMPLATES["remark"] + ("slides.css",)]
+    if (sourceDir / "slides.css").is_file():
+        paths.append(sourceDir / "slides.css")
+    return paths + includedFiles(includes)
+
+def buildOptions(args) -> dict:
+    """
+    the options an output depends on, a change in any of them rebuilds every deck
+    """
+    return {"version": metadata.version("autoslides"), "verbose": args.verbose, "allowIncludes": args.allow_includes}
+
+def fileInputs(source:Path, entry) -> list:
+    """
+    the files a deck depends on, the images and includes of a source are only looked up again once the source is rebuilt
+    """
+    files = entry["inputs"].keys() if entry is not None else []
+    return [str(source)] + [file for file in files if file != str(source)]
+
+def summary(results:list, wallTime:float, slowest = 5, upToDate = 0, removed = 0) -> str:
+    failures = [result for result in results if result[2] is not None]
+    workerTime = sum(result[1] for result in results)
+    report = ""
+    report += f"built {len(results) - len(failures)} of {len(results)} files in {wallTime:.2f}s"
+    report += f" ({workerTime:.2f}s of worker time)"
+    report += f", {upToDate} up to date, {removed} removed\n"
+    for source, seconds, error in sorted(results, key = lambda result: result[1], reverse = True)[:slowest]:
+        report += f"  {seconds:8.3f}s  {source}\n"
+    for source, seconds, error in failures:
+        report += f"failed: {source}: {error}\n"
+    return report
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "autoslides build")
+    parser.add_argument("source", type = str, help = "directory containing markdown sources")
+    parser.add_argument("--out", type = str, required = True, help = "html output directory")
+    parser.add_argument("-j", "--jobs", type = int, default = os.cpu_count(), help = "number of worker processes")
+    parser.add_argument("-v", "--verbose", action = "store_true", help = "enable complete paragraph rendering")
+    parser.add_argument("--include", type = str, action = "append", default = [], help = "a file or directory every deck depends on, changing it rebuilds every deck")
+    parser.add_argument("--allow-includes", action = "store_true", help = "let csv and tsv fences read include= files from the directory of their document")
+    parser.add_argument("--force", action = "store_true", help = "rebuild every deck even if it is up to date")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    sourceDir = Path(args.source)
+    outputDir = Path(args.out)
+    manifestPath = outputDir / MANIFEST_NAME
+    previous = loadManifest(manifestPath)
+    previousFiles = previous.get("files", {})
+    options = buildOptions(args)
+    shared = inputRecords(sharedInputs(sourceDir, args.include), previous.get("shared", {}))
+    rebuildAll = args.force or previous.get("options") != options or not sameContent(shared, previous.get("shared", {}))
+
+    files = {}
+    jobs = []
+    for source in markdownSources(sourceDir):
+        title = os.path.relpath(source, sourceDir)
+        output = outputPath(source, sourceDir, outputDir)
+        entry = previousFiles.get(title)
+        inputs = inputRecords(fileInputs(source, entry), entry["inputs"] if entry is not None else {})
+        if rebuildAll or entry is None or entry["output"] != str(output) or not output.is_file() or not sameContent(inputs, entry["inputs"]):
+            jobs.append((str(source), str(output), title))
+        else:
+            files[title] = {"output": str(output), "inputs": inputs}
+
+    removed = 0
+    rebuilt = {title for source, output, title in jobs}
+    for title, entry in previousFiles.items():
+        if title not in files and title not in rebuilt:
+            if os.path.exists(entry["output"]): #the source of this deck was removed
+                os.remove(entry["output"])
+                removed += 1
+
+    results = []
+    if len(jobs) > 0:
+        with ProcessPoolExecutor(max_workers = min(args.jobs, len(jobs)), initializer = templates) as pool:
+            futures = [pool.submit(buildFile, source, output, title, args.verbose, args.allow_includes) for source, output, title in jobs]
+            for future in as_completed(futures):
+                results.append(future.result())
+
+    failed = {result[0] for result in results if result[2] is not None}
+    for source, output, title in jobs:
+        if source not in failed: #failed decks are left out of the manifest so that they are retried
+            inputs = [source] + [str(image) for image in referencedFiles(Path(source))]
+            files[title] = {"output": output, "inputs": inputRecords(inputs, {})}
+    manifest = {"options": options, "shared": shared, "files": files}
+    if manifest != previous:
+        outputDir.mkdir(parents = True, exist_ok = True)
+        saveManifest(manifestPath, manifest)
+
+    print(summary(results, time.perf_counter() - start, upToDate = len(files) - len(results) + len(failed), removed = removed), end = "")
+    return 1 if len(failed) > 0 else 0
@@ -4,11 +4,16 @@ from mistletoe.block_token import Paragraph, Heading, List, ListItem, BlockToken
 from mistletoe.span_token import LineBreak, RawText, Strong, Emphasis, Image, EscapeSequence, SpanToken
 from mistletoe.token import Token
 from autoslides.head import Head
+import csv
 import math
 import re
-from autoslides.args import LINES, LINEWIDTH
-from autoslides.component import Component, IndentedListItem, Sentence, MathLine, CodeLine, Row, StrongSentence, EmphasizedSentence, collapse
-from autoslides.utils import rawTex, extractedMathEnvironments, delimitedTextToken, SentenceDelimiter
+from autoslides.args import LINES, LINEWIDTH, PAGINATOR, MULTILINE_ENVIRONMENTS, HIGHLIGHT_CLASS
+from autoslides.component import Component, IndentedListItem, Sentence, MathLine, CodeLine, HighlightedCodeLine, StrongSentence, EmphasizedSentence, collapse
+from autoslides.paginate import PAGINATORS
+from autoslides.table import DELIMITERS, InvalidFenceException, tokenTable, fencedTable, fenceLayout
+from autoslides.sink import OutputSink
+from autoslides.profiling import span
+from autoslides.utils import rawTex, splitTexLines, delimitedTextToken, SentenceDelimiter
 
 
 class UnsupportedTokenException(Exception):
@@ -94,15 +99,22 @@ class Block(ABC):
         return [IndentedListItem(self, level=level, indentSize=indentSize, leader=leader)]
 
     @abstractmethod
-    def slideContent(self, components, head:Head):
+    def slideContent(self, out:OutputSink, components, head:Head):
         """
-        slideContent builds a slide based on given components and header.
+        slideContent writes a slide based on given components and header into out.
         The slide built depends on the type of block
         """
         pass
 
-    def mdSlides(self, head:Head, lines=LINES):
-        return f"{self.slideContent(head)}\n---\n\n" 
+    def writeSlides(self, out:OutputSink, head:Head, lines=LINES, lineWidth=LINEWIDTH, paginator=PAGINATOR):
+        with span("render", block = type(self).__name__):
+            self.slideContent(out, [], head)
+            out.endSlide("\n---\n\n")
+
+    def mdSlides(self, head:Head, lines=LINES, lineWidth=LINEWIDTH, paginator=PAGINATOR) -> str:
+        out = OutputSink()
+        self.writeSlides(out, head, lines, lineWidth, paginator)
+        return out.getvalue()
 
     def isLooseItem(self):
         return False
@@ -114,9 +126,11 @@ class Block(ABC):
         return "> " + "\n> ".join(str(self).split("\n"))
 
 
-def asBlock(token:BlockToken, verbose = True) -> Block:
+def asBlock(token:BlockToken, verbose = True, includeDirectory = None) -> Block:
     """
     convert mistletoe.block_token.BlockToken into Blocks
+    csv and tsv fences may include files from includeDirectory (see autoslides.table.includedPath),
+    a table fence with bad options or an include that cannot be read is kept as a code block
     """
     if isinstance(token, Paragraph) and isMathBlock(token):
         return MathBlock(token)
@@ -130,6 +144,11 @@ def asBlock(token:BlockToken, verbose = True) -> Block:
         return ListBlock(token)
     elif isinstance(token, ListItem):
         return Item(token)
+    elif isinstance(token, CodeFence) and token.language in DELIMITERS:
+        try:
+            return TableBlock(token, includeDirectory)
+        except (InvalidFenceException, OSError, UnicodeDecodeError, csv.Error):
+            return CodeBlock(token)
     elif isinstance(token, CodeFence):
         return CodeBlock(token)
     elif isinstance(token, Quote):
@@ -147,39 +166,45 @@ class CompositeBlock(Block):
     composite blocks can be split into multiple slides, split is based on number of lines
     """
 
-    def slides(self, head:Head, lines=LINES, lineWidth=LINEWIDTH) -> list:
-        if len(self.components()) == 0:
-            return []
+    def layout(self, lineWidth=LINEWIDTH) -> list:
+        """
+        the heights of all components, measured once per lineWidth and kept on the block
+        """
+        layout = getattr(self, "_CompositeBlock__layout", None)
+        if layout is None or layout[0] != lineWidth:
+            heights = [component.measuredHeight(lineWidth) if isinstance(component, Component) else component.height(lineWidth)
+                       for component in self.components()]
+            layout = (lineWidth, heights)
+            self.__layout = layout
+        return layout[1]
+
+    def slides(self, head:Head, lines=LINES, lineWidth=LINEWIDTH, paginator=PAGINATOR) -> list:
+        """
+        paginator names the pagination engine in autoslides.paginate.PAGINATORS
+        """
         slides = []
-        currentHeight = self.components()[0].height(lineWidth) if len(self.components()) > 0 else 0
-        currentSlide = [self.components()[0]] if len(self.components()) > 0 else []
-        for component in self.components()[1:]:
-            if currentHeight + component.height(lineWidth) > lines:
-                slides.append(self.slideContent(currentSlide, head))
-                currentSlide = [component]
-                currentHeight = component.height(lineWidth)
-            else:
-                currentSlide.append(component)
-                currentHeight += component.height(lineWidth)
-        slides.append(self.slideContent(currentSlide, head))
+        components = self.components()
+        for start, end in PAGINATORS[paginator](self.layout(lineWidth), lines):
+            out = OutputSink()
+            self.slideContent(out, components[start:end], head)
+            slides.append(out.getvalue())
         return slides
 
-    def mdSlides(self, head:Head, lines=LINES) -> str:
-        subDeck = ""
-        for slide in self.slides(head, lines):
-            subDeck += f"{slide}\n"
-            subDeck += "\n---\n\n"
-        return subDeck
+    def writeSlides(self, out:OutputSink, head:Head, lines=LINES, lineWidth=LINEWIDTH, paginator=PAGINATOR):
+        components = self.components()
+        with span("pagination", block = type(self).__name__):
+            ranges = PAGINATORS[paginator](self.layout(lineWidth), lines)
+        with span("render", block = type(self).__name__):
+            for start, end in ranges:
+                self.slideContent(out, components[start:end], head)
+                out.endSlide("\n\n---\n\n")
 
     @abstractmethod
     def components(self) -> list:
         pass
 
     def height(self, lineWidth=LINEWIDTH):
-        cumulativeHeight = 0
-        for component in self.components():
-            cumulativeHeight += component.height(lineWidth)
-        return cumulativeHeight
+        return sum(self.layout(lineWidth))
 
 
 class UnrenderedBlock(Block):
@@ -189,30 +214,88 @@ class UnrenderedBlock(Block):
     def itemized(self, level=0, indentSize=0, leader=""):
         return []
 
-    def slideContent(self, components, head:Head):
-        return ""
+    def slideContent(self, out:OutputSink, components, head:Head):
+        pass
 
-    def mdSlides(self, head:Head, lines=LINES):
-        return ""
+    def writeSlides(self, out:OutputSink, head:Head, lines=LINES, lineWidth=LINEWIDTH, paginator=PAGINATOR):
+        pass
 
     def isLooseItem(self):
         return True
 
 
+def isImportant(spanList:list) -> bool:
+    """
+    whether a sentence collapses into an EmphasizedSentence or a StrongSentence,
+    decided from its span tokens without rendering it
+    """
+    return any(isinstance(token, (Emphasis, Strong)) for token in spanList)
+
+def emphasisDensity(spanList:list) -> float:
+    """
+    the share of a sentence's text that is emphasized, strong text counts twice
+    """
+    emphasized = 0
+    total = 0
+    stack = [(token, 0) for token in spanList]
+    while len(stack) > 0:
+        token, weight = stack.pop()
+        if isinstance(token, Strong):
+            weight = 2
+        elif isinstance(token, Emphasis):
+            weight = max(weight, 1)
+        if isinstance(token, RawText):
+            total += len(token.content)
+            emphasized += len(token.content) * weight
+        elif getattr(token, "children", None) is not None:
+            stack.extend((child, weight) for child in token.children)
+    return emphasized / total if total > 0 else 0.0
+
+def budgetedParagraphs(paragraphs:list, maxBullets:int):
+    """
+    keeps the maxBullets sentences with the highest emphasis density across paragraphs (ParagraphBlocks),
+    ties go to the earlier sentence and the kept sentences stay in document order
+    """
+    ranked = []
+    for i, paragraph in enumerate(paragraphs):
+        for j, density in enumerate(paragraph.densities()):
+            ranked.append((-density, i, j))
+    kept = [set() for _ in paragraphs]
+    for density, i, j in sorted(ranked)[:maxBullets]:
+        kept[i].add(j)
+    for paragraph, sentences in zip(paragraphs, kept):
+        paragraph.keep(sentences)
+
+
 class ParagraphBlock(CompositeBlock):
+    """
+    in non verbose mode the sentences without emphasis are dropped before they are rendered,
+    the emphasis density of every sentence is kept for budgetedParagraphs so the span tokens are not
+    """
 
     def __init__(self, mdParagraph:Paragraph, verbose = True):
-        self.__mdParagraph = mdParagraph
-        self.__sentences = [collapse(spanList) for spanList in self.decompose()]
+        spanLists = self.decompose(mdParagraph)
         if not verbose:
-            self.__sentences = [sentence for sentence in self.__sentences if (isinstance(sentence, EmphasizedSentence) or isinstance(sentence, StrongSentence))]
+            spanLists = [spanList for spanList in spanLists if isImportant(spanList)]
+        self.__densities = [emphasisDensity(spanList) for spanList in spanLists]
+        self.__sentences = [collapse(spanList) for spanList in spanLists]
+
+    def densities(self) -> list:
+        return self.__densities
+
+    def keep(self, indices:set):
+        """
+        keeps only the sentences at the given indices
+        """
+        self.__sentences = [sentence for i, sentence in enumerate(self.__sentences) if i in indices]
+        self.__densities = [density for i, density in enumerate(self.__densities) if i in indices]
 
-    def decompose(self) -> list:
+    def decompose(self, mdParagraph:Paragraph) -> list:
         """
         Decompose a paragraph into list of span tokens based on SoftBreaks (single line breaks)
         """
         spanTokenList = []
-        for child in self.__mdParagraph.children:
+        for child in mdParagraph.children:
             if isinstance(child, RawText):
                 spanTokenList += delimitedTextToken(child)
             else:
@@ -231,17 +314,15 @@ class ParagraphBlock(CompositeBlock):
     def components(self):
         return self.__sentences
 
-    def slideContent(self, components:list, head:Head) -> str:
-        md = ""
-        md += f"# {head.headText()}\n"
-        md += "\n"
+    def slideContent(self, out:OutputSink, components:list, head:Head):
+        out.write(f"# {head.headText()}\n")
+        out.write("\n")
         for sentence in components:
-            md += f"- {sentence}\n"
-        return md
+            out.write(f"- {sentence}\n")
 
     def __str__(self) -> str:
         cumulativeString = ""
-        for sentence in self.__sentences:
+        for sentence in self.components():
             cumulativeString += f"{sentence} "
         return f"{cumulativeString[:-1]}"
 
@@ -252,10 +333,10 @@ class Item:
 
     def __init__(self, mdContent:Block):
         self.__leader = mdContent.leader
-        self.__content = mdContent
         self.__indentSize = len(self.__leader) + 1
         self.__children = []
-        for child in self.__content.children:
+        self.__index = None
+        for child in mdContent.children:
             self.__children.append(asBlock(child, verbose = True))
 
     def height(self, lineWidth=LINEWIDTH):
@@ -264,65 +345,106 @@ class Item:
             cumulativeHeight += child.height(lineWidth)
         return cumulativeHeight
 
-    def content(self):
-        return self.__content
+    def children(self) -> list:
+        return self.__children
 
-    def itemized(self, level=0, indentSize=0, leader=""):
+    def nestedFrames(self, level:int) -> list:
         """
-        itemizing an item returns the item and any nested list items children
+        the (block, level, indentSize, leader) arguments the children of this item are itemized with
         """
-        itemsDFS = []
+        frames = []
         if len(self.__children) > 0:
-            itemsDFS += self.__children[0].itemized(
-                    level=level+1, 
-                    indentSize=self.__indentSize, 
-                    leader=f"{self.__leader} "
-            )
+            frames.append((self.__children[0], level+1, self.__indentSize, f"{self.__leader} "))
             for child in self.__children[1:]:
-                #itemsDFS.append(child)
-                itemsDFS += child.itemized(level=level+1, indentSize=self.__indentSize, leader="")
-        return itemsDFS
+                frames.append((child, level+1, self.__indentSize, ""))
+        return frames
+
+    def itemized(self, level=0, indentSize=0, leader=""):
+        """
+        itemizing an item returns the item and any nested list items children
+        the top level itemization is built once and kept as this item's flattened index
+        """
+        if level != 0:
+            return flattenedItems(self, level, indentSize, leader)
+        if self.__index is None:
+            self.__index = flattenedItems(self)
+        return self.__index
 
     def __str__(self) -> str:
-        components = self.itemized()
-        md = ""
-        md += f"{components[0]}\n"
-        for i in range(1, len(components)):
-            if components[i].isLooseItem() and components[i].level() == components[i-1].level():
-                md += "\n"
-            md += f"{components[i]}\n"
-        return md
+        return itemsMarkdown(self.itemized())
 
     def components(self) -> list:
         return self.itemized()
 
 
+def flattenedItems(block, level=0, indentSize=0, leader="") -> list:
+    """
+    itemizes a list or list item depth first into IndentedListItems,
+    an explicit stack is used so deeply nested lists cost O(n) and never hit the recursion limit
+    """
+    itemsDFS = []
+    stack = [(block, level, indentSize, leader)]
+    while len(stack) > 0:
+        block, level, indentSize, leader = stack.pop()
+        if isinstance(block, Item):
+            stack.extend(reversed(block.nestedFrames(level)))
+        elif isinstance(block, ListBlock):
+            stack.extend((item, level, indentSize, leader) for item in reversed(block.children()))
+        else:
+            itemsDFS.extend(block.itemized(level=level, indentSize=indentSize, leader=leader))
+    return itemsDFS
+
+def itemsMarkdown(items:list, itemStarts = ()) -> str:
+    """
+    renders itemized list items, loose items are separated from their siblings by a blank line
+    except for the items in itemStarts, which start a new top level item of a list
+    """
+    if len(items) == 0:
+        return ""
+    md = [f"{items[0]}\n"]
+    for i in range(1, len(items)):
+        if items[i].isLooseItem() and items[i].level() == items[i-1].level() and items[i] not in itemStarts:
+            md.append("\n")
+        md.append(f"{items[i]}\n")
+    return "".join(md)
+
+
 class ListBlock(CompositeBlock):
 
     def __init__(self, mdList:List):
-        self.__mdList = mdList
         self.__children = []
-        for item in self.__mdList.children:
+        for item in mdList.children:
             self.__children.append(asBlock(item, verbose = True)) #are always ListItem instances probably
-        #self.__itemsDFS = self.itemized()
-
-    def height(self, lineWidth=LINEWIDTH):
-        cumulativeHeight = 0
-        for child in self.__children:
-            cumulativeHeight += child.height(lineWidth)
-        return cumulativeHeight
+        self.__index = None
+        self.__itemStarts = None #the first entry of every top level item
 
     def nthItem(self, n:int) -> Block:
-        return self.__items[n]
-    
+        return self.__children[n]
+
+    def children(self) -> list:
+        return self.__children
+
     def itemized(self, level=0, indentSize=0, leader="") -> list:
-        itemsDFS = []
-        for item in self.__children:
-            itemsDFS += item.itemized(level=level, indentSize=indentSize, leader=leader)
-        return itemsDFS
+        """
+        the top level itemization is the list's flattened index, it reuses the index of every item
+        """
+        if level != 0 or indentSize != 0 or leader != "":
+            return flattenedItems(self, level, indentSize, leader)
+        if self.__index is None:
+            self.__index = []
+            self.__itemStarts = set()
+            for item in self.__children:
+                entries = item.itemized()
+                if len(entries) > 0:
+                    self.__itemStarts.add(entries[0])
+                self.__index += entries
+        return self.__index
 
     def components(self) -> list:
-        return self.__children
+        """
+        lists are paginated by the entries of the flattened index, so a long item can continue on the next slide
+        """
+        return self.itemized()
 
     def __str__(self) -> str:
         cumulativeString = ""
@@ -330,54 +452,62 @@ class ListBlock(CompositeBlock):
             cumulativeString += f"{items}\n"
         return cumulativeString[:-1]
 
-    def slideContent(self, components:list, head:Head) -> str:
-        md = ""
-        md += f"# {head.headText()}\n"
-        md += "\n"
-        for component in components:
-            md += f"{component}"
-        return md
+    def slideContent(self, out:OutputSink, components:list, head:Head):
+        out.write(f"# {head.headText()}\n")
+        out.write("\n")
+        out.write(itemsMarkdown(components, self.__itemStarts))
 
 class CodeBlock(CompositeBlock):
 
     def __init__(self, mdCodeFence:CodeFence):
         self.__language = mdCodeFence.language
+        self.__highlighted = False
         self.__lines = []
         for lineContent in mdCodeFence.children[0].content.split("\n"):
             self.__lines.append(CodeLine(lineContent))
 
+    def highlight(self, highlighter):
+        """
+        highlights the code with a Highlighter (see autoslides.highlight) if it knows the language,
+        the slides are then written as html and paginated by the same lines
+        """
+        lines = highlighter.highlightedLines(self.__language, "\n".join(str(line) for line in self.__lines))
+        if lines is not None:
+            self.__lines = [HighlightedCodeLine(str(line), html) for line, html in zip(self.__lines, lines)]
+            self.__highlighted = True
+
     def components(self):
         return self.__lines
 
-    def slideContent(self, components:list, head:Head) -> str:
-        md = ""
-        md += f"# {head.headText()}\n"
-        md += "\n"
-        md += f"```{self.__language}\n"
+    def slideContent(self, out:OutputSink, components:list, head:Head):
+        out.write(f"# {head.headText()}\n")
+        out.write("\n")
+        if self.__highlighted:
+            out.writeHtml(f'<pre class="{HIGHLIGHT_CLASS}"><code class="language-{self.__language}">')
+            out.writeHtml("\n".join(line.html() for line in components))
+            out.writeHtml("</code></pre>")
+            return
+        out.write(f"```{self.__language}\n")
         for line in components:
-            md += f"{line}\n"
-        md += "```"
-        return md
+            out.write(f"{line}\n")
+        out.write("```")
 
 
 class QuoteBlock(CompositeBlock):
 
     def __init__(self, mdContent):
-        self.__mdQuote = mdContent
         self.__children = []
-        for child in self.__mdQuote.children:
+        for child in mdContent.children:
             self.__children.append(asBlock(child, verbose = True))
 
     def components(self):
         return self.__children
 
-    def slideContent(self, components:list, head:Head) -> str:
-        md = ""
-        md += f"# {head.headText()}\n"
-        md += "\n"
+    def slideContent(self, out:OutputSink, components:list, head:Head):
+        out.write(f"# {head.headText()}\n")
+        out.write("\n")
         for line in components:
-            md += f"{line.quotedStr()}\n> \n"
-        return md
+            out.write(f"{line.quotedStr()}\n> \n")
 
     def __str__(self) -> str:
         cumulativeString = ""
@@ -388,47 +518,29 @@ class QuoteBlock(CompositeBlock):
 
 class MathBlock(CompositeBlock):
 
-    def __init__(self, mdParagraph:Paragraph):
+    def __init__(self, mdParagraph:Paragraph, environments = MULTILINE_ENVIRONMENTS):
         self.__isAligned = False
         jointLines = rawTex(mdParagraph) 
         if jointLines.startswith("\\begin{aligned}") and jointLines.endswith("\\end{aligned}"):
             self.__isAligned = True
             jointLines = jointLines[15:-13]
-        multilineEnvironments = ["bmatrix","matrix"]
-        extractedBlocks = {}
-        #remove all multiline blocks (e.g. matrices) while saving removed blocks to extractedBlocks
-        for env in multilineEnvironments:
-            exME = extractedMathEnvironments(jointLines, env)
-            jointLines = exME["replacedMathBlock"]
-            extractedBlocks[env] = exME["extractedBlocks"]
-        #now that all multiline blocks are gone, replace newline separators with $$nl$$ token
-        #this replacement is now safe since there are no multiline environments in the string
-        jointLines = jointLines.replace("\\\\", "$$nl$$")
-        #place all extracted blocks back
-        for env in multilineEnvironments:
-            for block in extractedBlocks[env]:
-                jointLines = jointLines.replace(f"$${env}$$", block, 1)
-        #safely split the math block using the $$nl$$ token
-        self.__lines = [MathLine(line) for line in jointLines.split("$$nl$$")]
+        #split on top level newlines only, multiline environments (e.g. matrices) stay on one line
+        self.__lines = [MathLine(line) for line in splitTexLines(jointLines, environments)]
 
     def components(self):
         return self.__lines
 
-    def slideContent(self, components:list, head:Head) -> str:
-        md = ""
-        md += f"# {head.headText()}\n"
-        md += "\n"
-        md += f"`\n$$\n"
+    def slideContent(self, out:OutputSink, components:list, head:Head):
+        out.write(f"# {head.headText()}\n")
+        out.write("\n")
+        out.write(f"`\n$$\n")
         if self.__isAligned:
-            md += "\\begin{aligned}\n"
+            out.write("\\begin{aligned}\n")
         for line in components:
-            md += f"{line}\\\\\n"
-        if len(components) > 0:
-            md = f"{md[:-1]}\n"#remove the latex newline "\\" on the last line  
+            out.write(f"{line}\\\\\n")
         if self.__isAligned:
-            md += "\\end{aligned}\n"
-        md += "$$\n`"
-        return md
+            out.write("\\end{aligned}\n")
+        out.write("$$\n`")
 
     def __str__(self) -> str:
         cumulativeString = ""
@@ -442,55 +554,64 @@ class MathBlock(CompositeBlock):
 
 
 class TableBlock(CompositeBlock):
-    
-    def __init__(self, content:Table):
-        self.__header = Row(content.header)
-        self.__rows = [Row(child) for child in content.children]
-        self.__alignmentRow = "|" if len(content.header.children) > 0 else ""
-        for alignCode in content.column_align:
-            if alignCode is None:
-                self.__alignmentRow += ":----|"
-            elif alignCode == 0:
-                self.__alignmentRow += ":---:|"
-            else:
-                self.__alignmentRow += "----:|"
+    """
+    a table kept column by column (see autoslides.table.ColumnarTable) and paginated over its row heights,
+    csv and tsv fences become tables too, their options pick whether the header is repeated on every slide (header=repeat|once)
+    and split wide tables into groups of columns (columns=N|auto) that are paginated one after the other
+    """
+
+    def __init__(self, content, includeDirectory = None):
+        self.__repeatHeader = True
+        self.__columnsPerSlide = None
+        if isinstance(content, CodeFence):
+            self.__repeatHeader, self.__columnsPerSlide = fenceLayout(content)
+            self.__table = fencedTable(content, includeDirectory)
+        else:
+            self.__table = tokenTable(content)
 
+    def layout(self, lineWidth=LINEWIDTH) -> list:
+        return self.__table.rowHeights(range(self.__table.columnCount()), lineWidth)
 
     def height(self, lineWidth=LINEWIDTH):
-        cumulativeHeight = self.__header.height(lineWidth)
-        for row in self.__rows:
-            cumulativeHeight += row.height(lineWidth)
-        return cumulativeHeight
+        return self.__table.headerHeight(range(self.__table.columnCount()), lineWidth) + sum(self.layout(lineWidth))
 
     def components(self):
-        return self.__rows
+        return range(self.__table.rowCount())
+
+    def writeSlides(self, out:OutputSink, head:Head, lines=LINES, lineWidth=LINEWIDTH, paginator=PAGINATOR):
+        for columns in self.__table.columnGroups(self.__columnsPerSlide, lineWidth):
+            with span("pagination", block = type(self).__name__):
+                ranges = PAGINATORS[paginator](self.__table.rowHeights(columns, lineWidth), lines)
+            with span("render", block = type(self).__name__):
+                for number, (start, end) in enumerate(ranges):
+                    self.__writeTable(out, range(start, end), columns, head, blankHeader = number > 0 and not self.__repeatHeader)
+                    out.endSlide("\n\n---\n\n")
+
+    def slideContent(self, out:OutputSink, components:range, head:Head):
+        self.__writeTable(out, components, range(self.__table.columnCount()), head)
 
-    def slideContent(self, components:list, head:Head):
-        md = ""
-        md += f"# {head.headText()}\n"
-        md += "\n"
-        md += f"{str(self.__header)}\n"
-        md += f"{str(self.__alignmentRow)}\n"
-        for row in components:
-            md += f"{str(row)}\n"
-        return md
+    def __writeTable(self, out:OutputSink, rows:range, columns:range, head:Head, blankHeader = False):
+        out.write(f"# {head.headText()}\n")
+        out.write("\n")
+        out.write(f"{self.__table.headerMarkdown(columns, blankHeader)}\n")
+        out.write(f"{self.__table.alignmentMarkdown(columns)}\n")
+        for row in rows:
+            out.write(f"{self.__table.rowMarkdown(row, columns)}\n")
 
 
 class ImageBlock(Block):
 
     def __init__(self, paragraph:Paragraph):
-        self.__mdImage = paragraph.children[0]
-        self.__altText:Sentence = collapse(self.__mdImage.children)
-        self.__title = self.__mdImage.title
-        self.__src = self.__mdImage.src
+        mdImage = paragraph.children[0]
+        self.__altText:Sentence = collapse(mdImage.children)
+        self.__title = mdImage.title
+        self.__src = mdImage.src
 
     def height(self, lineWidth=LINEWIDTH):
         return 1
 
-    def slideContent(self, head:Head):
-        md = ""
-        md += f"# {head.headText()}\n"
-        md += "\n"
-        md += f"![{self.__altText}]({self.__src})"
-        md += "\n"
-        return md
+    def slideContent(self, out:OutputSink, components:list, head:Head):
+        out.write(f"# {head.headText()}\n")
+        out.write("\n")
+        out.write(f"![{self.__altText}]({self.__src})")
+        out.write("\n")
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from importlib import metadata
+from pathlib import Path
+import hashlib
+import os
+import threading
+
+DEFAULT_CACHE_DIR = ".autoslides-cache"
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+try:
+    VERSION = metadata.version("autoslides")
+except metadata.PackageNotFoundError:
+    VERSION = "unknown"
+
+
+def sectionKey(source:str, *options) -> str:
+    """
+    hashes a section source together with everything that affects how it is rendered,
+    the package version is always part of the key so upgrades never reuse stale slides
+    """
+    digest = hashlib.sha256()
+    for part in (VERSION, *options):
+        digest.update(f"{part}\0".encode())
+    digest.update(source.encode())
+    return digest.hexdigest()
+
+
+class SectionCache:
+    """
+    least recently used cache of rendered section slides
+    entries are persisted under directory if one is given, otherwise they are only kept in memory
+    the cache is trimmed to maxBytes by evicting the least recently used entries
+    get and put can be called from several threads
+    """
+
+    def __init__(self, directory = None, maxBytes = DEFAULT_CACHE_SIZE):
+        self.__directory = Path(directory) if directory is not None else None
+        self.__maxBytes = maxBytes
+        self.__entries = OrderedDict() #key -> size, least recently used first
+        self.__memory = {}
+        self.__size = 0
+        self.__lock = threading.Lock()
+        if self.__directory is not None:
+            self.__directory.mkdir(parents = True, exist_ok = True)
+            files = [entry for entry in os.scandir(self.__directory) if entry.is_file() and not entry.name.endswith(".tmp")]
+            for entry in sorted(files, key = lambda entry: entry.stat().st_mtime):
+                self.__entries[entry.name] = entry.stat().st_size
+                self.__size += entry.stat().st_size
+
+    def get(self, key:str):
+        with self.__lock:
+            if key not in self.__entries:
+                return None
+            self.__entries.move_to_end(key)
+            if self.__directory is None:
+                return self.__memory[key]
+            path = self.__directory / key
+            try:
+                slides = path.read_text()
+                os.utime(path) #the modification time records recency across runs
+            except FileNotFoundError:
+                self.__size -= self.__entries.pop(key)
+                return None
+            return slides
+
+    def put(self, key:str, slides:str):
+        with self.__lock:
+            if key in self.__entries:
+                self.__size -= self.__entries.pop(key)
+            if self.__directory is None:
+                self.__memory[key] = slides
+                size = len(slides)
+            else:
+                path = self.__directory / key
+                temporaryPath = self.__directory / f"{key}.{os.getpid()}.tmp"
+                temporaryPath.write_text(slides)
+                os.replace(temporaryPath, path)
+                size = path.stat().st_size
+            self.__entries[key] = size
+            self.__size += size
+            self.__evict()
+
+    def __evict(self):
+        while self.__size > self.__maxBytes and len(self.__entries) > 1:
+            key, size = self.__entries.popitem(last = False)
+            self.__size -= size
+            if self.__directory is None:
+                del self.__memory[key]
+            else:
+                try:
+                    os.remove(self.__directory / key)
+                except FileNotFoundError:
+                    pass
+
+    def __len__(self) -> int:
+        return len(self.__entries)
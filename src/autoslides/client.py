@@ -0,0 +1,61 @@
+from pathlib import Path
+from urllib.parse import urlencode
+import http.client
+
+CONVERT_PATH = "/convert"
+VERSION_PATH = "/version"
+DEFAULT_PORT_FILE = str(Path.home() / ".autoslides-serve")
+CONNECT_TIMEOUT = 0.5
+VERSION_HEADER = "X-Autoslides-Version" #sent with every response of autoslides serve
+
+
+def serverPort(portFile = DEFAULT_PORT_FILE):
+    """
+    the port of a running autoslides serve, None if no server wrote its port file
+    """
+    try:
+        return int(Path(portFile).read_text())
+    except (OSError, ValueError):
+        return None
+
+def serverVersion(port:int):
+    """
+    the version a listener on port answers with, None if it is not an autoslides serve
+    """
+    connection = http.client.HTTPConnection("localhost", port, timeout = CONNECT_TIMEOUT)
+    try:
+        connection.request("GET", VERSION_PATH)
+        response = connection.getresponse()
+        response.read()
+    except (OSError, http.client.HTTPException):
+        return None
+    finally:
+        connection.close()
+    return response.getheader(VERSION_HEADER) if response.status == 200 else None
+
+def convertRemotely(markdown:str, options:dict, version:str, portFile = DEFAULT_PORT_FILE):
+    """
+    forwards a conversion to a running autoslides serve and returns the deck,
+    None if there is no server or it could not convert, the caller then converts locally
+    the port file may be left over from a server that was killed and its port taken by another process,
+    so the markdown is only sent once the listener answered as an autoslides serve of the same version
+    this module only imports the standard library so the thin client starts quickly
+    """
+    port = serverPort(portFile)
+    if port is None or serverVersion(port) != version:
+        return None
+    connection = http.client.HTTPConnection("localhost", port, timeout = CONNECT_TIMEOUT)
+    try:
+        connection.connect()
+        connection.sock.settimeout(None) #a large deck may take a while, only the connection attempt is bounded
+        connection.request("POST", f"{CONVERT_PATH}?{urlencode(options)}", markdown.encode(),
+                           {"Content-Type": "text/markdown; charset=utf-8"})
+        response = connection.getresponse()
+        body = response.read().decode()
+    except (OSError, http.client.HTTPException, UnicodeDecodeError):
+        return None
+    finally:
+        connection.close()
+    if response.status != 200 or response.getheader(VERSION_HEADER) != version:
+        return None
+    return body
@@ -1,26 +1,47 @@
 from abc import ABC, abstractmethod
 from autoslides.args import LINEWIDTH
-from mistletoe.block_token import TableCell, TableRow
+from autoslides.measure import textHeight, codeHeight
 from mistletoe.span_token import Emphasis, Strong
+from mistletoe import Document
 from mistletoe.markdown_renderer import MarkdownRenderer
-import math
+from mistletoe.html_renderer import HTMLRenderer
+import threading
+
+#mistletoe keeps its token registry and the document being parsed in module globals,
+#a MarkdownRenderer context changes the registry until it exits so rendering and parsing must not overlap
+MISTLETOE_LOCK = threading.RLock()
 
 
 class Component(ABC):
     """
     CompositeBlocks are made up of Components
+    components are slotted since large documents have hundreds of thousands of them
     """
 
+    __slots__ = ("__measurement",)
+
     @abstractmethod
     def height(self, lineWidth=LINEWIDTH):
         pass
 
+    def measuredHeight(self, lineWidth=LINEWIDTH) -> int:
+        """
+        height() measured only once per lineWidth, the last measurement is kept on the component
+        """
+        measurement = getattr(self, "_Component__measurement", None)
+        if measurement is None or measurement[0] != lineWidth:
+            measurement = (lineWidth, self.height(lineWidth))
+            self.__measurement = measurement
+        return measurement[1]
+
 
 class Sentence(Component):
     """
     base class that can be decorated by StrongSentence and EmphasizedSentence
     """
 
+    __slots__ = ("__sentence",)
+
     def __init__(self,sentence:str):
         self.__sentence = sentence
 
@@ -34,11 +55,13 @@ class Sentence(Component):
         return len(self.__sentence)
 
     def height(self, lineWidth=LINEWIDTH):
-        return math.ceil(self.size() / lineWidth)
+        return textHeight(str(self), lineWidth)
 
 
 class StrongSentence(Sentence):
 
+    __slots__ = ("__sentence", "__strongParts")
+
     def __init__(self,sentence:Sentence, strongParts:list):
         self.__sentence = sentence
         self.__strongParts = strongParts
@@ -58,6 +81,8 @@ class StrongSentence(Sentence):
 
 class EmphasizedSentence(Sentence):
 
+    __slots__ = ("__sentence", "__emphasizedParts")
+
     def __init__(self,sentence:Sentence,emphasizedParts:list):
         self.__sentence = sentence
         self.__emphasizedParts = emphasizedParts
@@ -77,6 +102,8 @@ class EmphasizedSentence(Sentence):
 
 class IndentedListItem(Component):
 
+    __slots__ = ("__level", "__content", "__leader", "__indentSize", "__prefix")
+
     def __init__(self, content:"Block", indentSize=0, level=0, leader=""):
         self.__level = level
         self.__content = content
@@ -89,7 +116,7 @@ class IndentedListItem(Component):
         return f"{self.__prefix}{self.__content}"
 
     def height(self, lineWidth=LINEWIDTH) -> int:
-        return math.ceil(len(str(self)) / lineWidth)
+        return textHeight(str(self), lineWidth)
 
     def level(self):
         return self.__level
@@ -100,18 +127,37 @@ class IndentedListItem(Component):
 
 class CodeLine(Component):
 
+    __slots__ = ("__content",)
+
     def __init__(self, content):
         self.__content = content
 
     def height(self, lineWidth=LINEWIDTH):
-        return math.ceil(len(self.__content) / lineWidth)
+        return codeHeight(self.__content, lineWidth)
 
     def __str__(self) -> str:
         return self.__content
 
 
+class HighlightedCodeLine(CodeLine):
+    """
+    a line of code together with its highlighted html, it is measured by the code alone
+    """
+
+    __slots__ = ("__html",)
+
+    def __init__(self, content, html:str):
+        super().__init__(content)
+        self.__html = html
+
+    def html(self) -> str:
+        return self.__html
+
+
 class MathLine(Component):
 
+    __slots__ = ("__mathTeX",)
+
     def __init__(self, mathTeX:str):
         self.__mathTeX = mathTeX
 
@@ -122,51 +168,38 @@ class MathLine(Component):
         return self.__mathTeX
 
 
-class Cell:
-
-    def __init__(self, content:TableCell):
-        self.__content = collapse(content.children)
-        self.__align = content.align
-
-    def height(self, lineWidth=LINEWIDTH) -> int:
-        return self.__content.height(lineWidth)
-
-    def __str__(self) -> str:
-        return str(self.__content)
-
-
-class Row(Component):
+def renderedMarkdown(token) -> str:
+    with MISTLETOE_LOCK, MarkdownRenderer() as renderer:
+        return renderer.render(token)
 
-    def __init__(self, content:TableRow):
-        self.__cells = [Cell(child) for child in content.children]
-
-    def height(self, lineWidth=LINEWIDTH):
-        tallestCell = self.__cells[0]
-        for cell in self.__cells[1:]:
-            if cell.height(lineWidth) > tallestCell.height(lineWidth):
-                tallestCell = cell
-        return tallestCell.height(lineWidth)
+def renderedHtml(markdown:str) -> str:
+    with MISTLETOE_LOCK, HTMLRenderer() as renderer:
+        return renderer.render(Document(markdown))
 
-    def __str__(self) -> str:
-        cumulativeString = "|" if len(self.__cells) > 0 else "" 
-        for cell in self.__cells:
-            cumulativeString += f" {str(cell)} |"
-        return cumulativeString
+def parsedDocument(source) -> Document:
+    """
+    parses markdown into a mistletoe Document, safe to call from several threads
+    """
+    with MISTLETOE_LOCK:
+        return Document(source)
 
-def collapse(spanList:list) -> Sentence:
+def collapse(spanList:list, renderer:MarkdownRenderer = None) -> Sentence:
     """
     Collapses a list of span tokens and returns Sentence
+    the whole sentence, nested parts included, is rendered with a single renderer
     """
+    if renderer is None:
+        with MISTLETOE_LOCK, MarkdownRenderer() as renderer:
+            return collapse(spanList, renderer)
     emphasizedParts = []
     strongParts = []
     mdSpanList = []
     for token in spanList:
         if isinstance(token, Emphasis):
-            emphasizedParts.append(collapse(token.children))
+            emphasizedParts.append(collapse(token.children, renderer))
         elif isinstance(token, Strong):
-            strongParts.append(collapse(token.children))
-        with MarkdownRenderer() as renderer:
-            mdSpanList.append(renderer.render(token)[:-1])
+            strongParts.append(collapse(token.children, renderer))
+        mdSpanList.append(renderer.render(token)[:-1])
 
     s = Sentence("".join(mdSpanList))
     if len(emphasizedParts) > 0:
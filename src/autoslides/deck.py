@@ -0,0 +1,148 @@
+from autoslides.mdPreprocess import preprocessedLines
+from autoslides.section import splitSections, writeSectionSlides
+from autoslides.cache import sectionKey
+from autoslides.table import includeStamps
+from autoslides.sink import OutputSink
+from autoslides.profiling import span, enabled
+from autoslides.args import LINES, LINEWIDTH, PAGINATOR
+from concurrent.futures import ProcessPoolExecutor
+from importlib import resources
+import functools
+
+
+PARALLEL_MIN_CHARS = 100000 #smaller documents are rendered serially, starting the workers would take longer
+
+TEMPLATES = {
+    "remark": ("slidesPre.html", "slidesPost.html"),
+    "html": ("htmlPre.html", "htmlPost.html"),
+    "split": ("htmlPre.html", "splitPost.html"), #the index page of a deck split into fragments
+}
+
+
+@functools.cache
+def templates(backend = "remark") -> tuple:
+    """
+    reads the html preamble and postamble that surround the slides of a backend,
+    the templates are only read once per process
+    """
+    preambleName, postambleName = TEMPLATES[backend]
+    preamble = resources.files("autoslides").joinpath(preambleName).read_text()
+    postamble = resources.files("autoslides").joinpath(postambleName).read_text()
+    return preamble, postamble
+
+def styledPreamble(preamble:str, highlighter = None) -> str:
+    """
+    adds the style sheet of the highlighting theme to the head of the page
+    """
+    if highlighter is None:
+        return preamble
+    return preamble.replace("</head>", f"{highlighter.styleElement()}</head>", 1)
+
+def layoutOverrides(metadata:dict, lines = LINES, lineWidth = LINEWIDTH) -> tuple:
+    """
+    the frontmatter of a document can override the slide layout with "lines" and "lineWidth" fields,
+    values that are not positive whole numbers are ignored
+    """
+    return layoutValue(metadata.get("lines"), lines), layoutValue(metadata.get("lineWidth"), lineWidth)
+
+def layoutValue(value, default:int) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    return number if number > 0 else default
+
+def writeSection(out:OutputSink, section:str, verbose = False, definitions = "", cache = None, paginator = PAGINATOR, lines = LINES, lineWidth = LINEWIDTH, assets = None, maxBullets = None, highlighter = None, includeDirectory = None):
+    """
+    writes the slides of one section, sections found in the cache (a SectionCache) are not parsed again
+    """
+    options = {"verbose": verbose, "definitions": definitions, "paginator": paginator, "lines": lines, "lineWidth": lineWidth, "assets": assets, "maxBullets": maxBullets, "highlighter": highlighter, "includeDirectory": includeDirectory}
+    with span(section[:section.find("\n")], "section"):
+        if cache is None:
+            writeSectionSlides(out, section, **options)
+            return
+        assetsKey = None if assets is None else (assets.key(), assets.stamps(definitions + section))
+        key = sectionKey(section, verbose, lines, lineWidth, paginator, definitions, assetsKey, out.BACKEND, maxBullets, includeStamps(section, includeDirectory), None if highlighter is None else highlighter.key())
+        slides = cache.get(key)
+        if slides is not None and assets is not None and not assets.copiesExist(slides):
+            slides = None #the copies of its images were removed since the section was cached
+        if slides is None:
+            sectionOut = out.fork()
+            writeSectionSlides(sectionOut, section, **options)
+            slides = sectionOut.getvalue()
+            cache.put(key, slides)
+        out.writeRendered(slides)
+
+def renderedSection(section:str, sinkClass:type, options:dict) -> str:
+    """
+    the slides of one section rendered into a new sink of sinkClass, this runs inside a pool worker
+    """
+    out = sinkClass()
+    writeSection(out, section, **options)
+    return out.getvalue()
+
+def parallelRendering(sections:list, jobs = 1, stream = False, assets = None) -> bool:
+    """
+    whether sections are worth rendering in a pool of processes,
+    never while profiling since the spans of pool workers would be lost
+    """
+    return jobs > 1 and not enabled() and not stream and assets is None and len(sections) > 1 and sum(len(section) for section in sections) >= PARALLEL_MIN_CHARS
+
+def renderedSections(sections:list, sinkClass:type, jobs:int, cache = None, **options) -> list:
+    """
+    the slides of every section, the sections that are not cached are rendered in a pool of jobs processes
+    every section is parsed on its own so the slides are the same as when they are rendered one after another
+    """
+    keys = [None] * len(sections)
+    slides = [None] * len(sections)
+    if cache is not None:
+        for i, section in enumerate(sections):
+            keys[i] = sectionKey(section, options["verbose"], options["lines"], options["lineWidth"], options["paginator"], options["definitions"], None, sinkClass.BACKEND, options["maxBullets"], includeStamps(section, options["includeDirectory"]), None if options["highlighter"] is None else options["highlighter"].key())
+            slides[i] = cache.get(keys[i])
+    missing = [i for i in range(len(sections)) if slides[i] is None]
+    if len(missing) == 0:
+        return slides
+    with ProcessPoolExecutor(max_workers = jobs) as pool:
+        chunksize = max(1, len(missing) // (jobs * 4))
+        rendered = pool.map(renderedSection, [sections[i] for i in missing], [sinkClass] * len(missing), [options] * len(missing), chunksize = chunksize)
+        for i, sectionSlides in zip(missing, rendered):
+            slides[i] = sectionSlides
+            if cache is not None:
+                cache.put(keys[i], sectionSlides)
+    return slides
+
+def writeSlides(out:OutputSink, processedLines, metadata:dict, stream = False, verbose = False, cache = None, paginator = PAGINATOR, lines = LINES, lineWidth = LINEWIDTH, assets = None, jobs = 1, maxBullets = None, highlighter = None, includeDirectory = None):
+    """
+    writes the slides of preprocessed markdown lines into out, one heading section at a time
+    with stream each section is read, rendered and written before the next one is read so memory use is
+    bounded by the largest section, but link reference definitions only resolve in the sections that follow them
+    with jobs > 1 large documents are rendered in a pool of processes (see parallelRendering)
+    """
+    lines, lineWidth = layoutOverrides(metadata, lines, lineWidth)
+    definitions = []
+    sections = splitSections(processedLines, definitions)
+    if not stream:
+        with span("preprocess"):
+            sections = list(sections)
+        definitions = ["".join(definitions)]
+        if parallelRendering(sections, jobs, stream, assets):
+            options = {"verbose": verbose, "definitions": definitions[0], "paginator": paginator, "lines": lines, "lineWidth": lineWidth, "maxBullets": maxBullets, "highlighter": highlighter, "includeDirectory": includeDirectory}
+            for sectionSlides in renderedSections(sections, type(out), jobs, cache, **options):
+                out.writeRendered(sectionSlides)
+            return
+    for section in sections:
+        writeSection(out, section, verbose, "".join(definitions), cache, paginator, lines, lineWidth, assets, maxBullets, highlighter, includeDirectory)
+
+def writeDeck(out:OutputSink, sourceLines, title:str, **options):
+    """
+    writes the complete html deck of markdown source lines into out,
+    the templates are chosen by the backend of out (see sink.SINKS)
+    a title in the frontmatter replaces the given title
+    options are passed on to writeSlides
+    """
+    metadata = {}
+    processedLines = preprocessedLines(sourceLines, metadata)
+    preamble, postamble = templates(out.BACKEND)
+    out.writeRendered(styledPreamble(preamble, options.get("highlighter")).replace("{Title}", metadata.get("title", title)))
+    writeSlides(out, processedLines, metadata, **options)
+    out.writeRendered(postamble)
@@ -1,6 +1,7 @@
 from mistletoe.block_token import Heading
 from autoslides.component import collapse
 from autoslides.args import LINEWIDTH
+from autoslides.sink import OutputSink
 
 class Head:
 
@@ -17,9 +18,12 @@ class Head:
     def level(self):
         return self.__level
 
+    def writeSlides(self, out:OutputSink):
+        out.write('class: center, middle\n')
+        out.write(f'# {self.headText()}')
+        out.endSlide('\n\n---\n')
+
     def mdSlides(self) -> str:
-        md = ''
-        md += 'class: center, middle\n'
-        md += f'# {self.headText()}'
-        md += '\n\n---\n'
-        return md
+        out = OutputSink()
+        self.writeSlides(out)
+        return out.getvalue()
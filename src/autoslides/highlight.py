@@ -0,0 +1,78 @@
+from autoslides.args import HIGHLIGHT_CLASS, HIGHLIGHT_THEME
+from autoslides.cache import SectionCache, DEFAULT_CACHE_SIZE
+import hashlib
+
+try:
+    import pygments
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.styles import get_style_by_name
+    from pygments.util import ClassNotFound
+except ImportError: #highlighting is optional, without pygments code is left to remark.js
+    pygments = None
+
+HIGHLIGHT_CACHE_DIR = "highlight" #inside the section cache directory
+
+
+def isTheme(theme:str) -> bool:
+    try:
+        get_style_by_name(theme)
+    except ClassNotFound:
+        return False
+    return True
+
+
+class Highlighter:
+    """
+    highlights code fences at build time with pygments into html spans, one line of html per line of code
+    highlighted fences are kept in a SectionCache (persisted if directory is given) keyed by the language,
+    a hash of the code and the theme, so an unchanged fence is never highlighted twice
+    """
+
+    def __init__(self, theme = HIGHLIGHT_THEME, directory = None, maxBytes = DEFAULT_CACHE_SIZE):
+        self.__theme = theme
+        self.__directory = directory
+        self.__maxBytes = maxBytes
+        self.__cache = SectionCache(directory, maxBytes)
+        self.__formatter = HtmlFormatter(style = theme, nowrap = True)
+        self.__lexers = {} #language -> lexer, None for languages pygments does not know
+
+    def __reduce__(self):
+        #pool workers get a highlighter of their own that shares the cache directory
+        return Highlighter, (self.__theme, self.__directory, self.__maxBytes)
+
+    def key(self) -> str:
+        return f"{self.__theme}-{pygments.__version__}"
+
+    def styleElement(self) -> str:
+        """
+        the style element with the css of the theme
+        """
+        return f"<style>\n{self.__formatter.get_style_defs(f'.{HIGHLIGHT_CLASS}')}\n</style>\n"
+
+    def __lexer(self, language:str):
+        """
+        looking a lexer up scans the installed pygments plugins, so it is only done once per language
+        """
+        if language not in self.__lexers:
+            try:
+                self.__lexers[language] = get_lexer_by_name(language, stripnl = False, ensurenl = False)
+            except ClassNotFound:
+                self.__lexers[language] = None
+        return self.__lexers[language]
+
+    def highlightedLines(self, language:str, code:str):
+        """
+        the html of every line of code, None if pygments has no lexer for language
+        a line of html closes every span it opens so the lines can be split across slides
+        """
+        lexer = self.__lexer(language)
+        if lexer is None:
+            return None
+        digest = hashlib.sha256(f"{language}\0{self.key()}\0{code}".encode()).hexdigest()
+        html = self.__cache.get(digest)
+        if html is None:
+            html = pygments.highlight(code, lexer, self.__formatter)
+            self.__cache.put(digest, html)
+        lines = html.split("\n")
+        return lines if len(lines) == code.count("\n") + 1 else None
@@ -1,45 +1,125 @@
-from autoslides.mdPreprocess import preprocess, truncatedFrontmatter, escapedMathUnderscores
-from autoslides.block import asBlock
-from mistletoe import Document
-from mistletoe.block_token import Heading
-from autoslides.component import collapse
-from autoslides.head import Head
+from autoslides.cache import SectionCache, DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, VERSION
+from autoslides.paginate import PAGINATORS
+from autoslides.args import PAGINATOR, BACKEND, HIGHLIGHT_THEME
+from autoslides.sink import SINKS
+from autoslides.client import convertRemotely, DEFAULT_PORT_FILE
 import argparse
-from importlib import resources
+import importlib
+import os
+import sys
+
+#subcommand -> module with a main(argv), imported only when it runs
+COMMANDS = {
+    "build": "autoslides.batch",
+    "watch": "autoslides.watch",
+    "serve": "autoslides.serve",
+}
+
+def forwarded(args, outputFileName:str) -> bool:
+    """
+    converts through a running autoslides serve, False if there is none
+    """
+    with open(args.source, "r") as file:
+        markdown = file.read()
+    options = {"title": args.source, "paginator": args.paginator, "backend": args.backend}
+    if args.verbose:
+        options["verbose"] = "1"
+    deck = convertRemotely(markdown, options, VERSION, args.port_file)
+    if deck is None:
+        return False
+    if outputFileName == "-":
+        sys.stdout.write(deck)
+    else:
+        with open(outputFileName, "w") as output:
+            output.write(deck)
+    return True
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        return importlib.import_module(COMMANDS[sys.argv[1]]).main(sys.argv[2:])
+
     parser = argparse.ArgumentParser()
     parser.add_argument("source", type = str, help = "markdown source file path")
-    parser.add_argument("output", type = str, help = "html output file path")
+    parser.add_argument("output", type = str, help = "html output file path, - writes to stdout")
     parser.add_argument("-v", "--verbose", action = "store_true", help = "enable complete paragraph rendering")
+    parser.add_argument("--cache", action = "store_true", help = "reuse the slides of unchanged sections from previous runs")
+    parser.add_argument("--cache-dir", type = str, default = DEFAULT_CACHE_DIR, help = "section cache directory")
+    parser.add_argument("--cache-size", type = int, default = DEFAULT_CACHE_SIZE // (1024 * 1024), help = "section cache size limit in MB")
+    parser.add_argument("--max-bullets", type = int, help = "keep at most this many paragraph sentences per section, the most emphasized ones")
+    parser.add_argument("--paginator", choices = PAGINATORS.keys(), default = PAGINATOR, help = "how blocks are split into slides")
+    parser.add_argument("--backend", choices = SINKS.keys(), default = BACKEND, help = "remark: markdown rendered by remark.js in the browser, html: slides rendered to html here")
+    parser.add_argument("--split", action = "store_true", help = "write html fragments per top level section and an index page that loads them on demand")
+    parser.add_argument("--split-level", type = int, default = 1, help = "with --split, headings of this level or higher start a new fragment")
+    parser.add_argument("-j", "--jobs", type = int, default = 1, help = "render the sections of large documents in this many processes")
+    parser.add_argument("--stream", action = "store_true", help = "convert the source one section at a time to bound memory use on very large documents")
+    parser.add_argument("--profile", action = "store_true", help = "print the time spent per stage, block type and section")
+    parser.add_argument("--trace", type = str, help = "write a Chrome trace event file of the conversion")
+    parser.add_argument("--assets", action = "store_true", help = "copy the referenced images into an assets directory next to the output")
+    parser.add_argument("--max-image-size", type = int, help = "with --assets, downscale images to at most this many pixels wide and high (needs Pillow)")
+    parser.add_argument("--highlight", action = "store_true", help = "highlight code at build time (needs pygments)")
+    parser.add_argument("--highlight-theme", type = str, metavar = "THEME", help = f"pygments theme of --highlight, {HIGHLIGHT_THEME} by default, implies --highlight")
+    parser.add_argument("--allow-includes", action = "store_true", help = "let csv and tsv fences read include= files from the directory of the source")
+    parser.add_argument("--no-server", action = "store_true", help = "convert in this process even if autoslides serve is running")
+    parser.add_argument("--port-file", type = str, default = DEFAULT_PORT_FILE, help = "port file of the autoslides serve to forward to")
     args = parser.parse_args()
-
-    file = open(args.source, "r")
-    truncatedMD = truncatedFrontmatter(file.read())
-    processedMD = escapedMathUnderscores(truncatedMD)
-    currentHead = None
-    preamblePath = resources.files("autoslides").joinpath("slidesPre.html")
-    postamblePath = resources.files("autoslides").joinpath("slidesPost.html")
-    preamble = open(preamblePath, "r").read().replace("{Title}", args.source)
-    postamble = open(postamblePath, "r").read()
+    if args.highlight_theme is not None:
+        args.highlight = True
 
     if args.output is not None:
         outputFileName = args.output
     else:
         outputFileName = f"{args.source.split(".")[0]}.html"
 
-    output = open(outputFileName, "w+")
-    output.write(preamble)
+    #the server keeps its own section cache, options it does not support are converted here
+    if not (args.max_bullets is not None or args.no_server or args.stream or args.profile or args.trace or args.assets or args.split or args.highlight or args.allow_includes) and forwarded(args, outputFileName):
+        return
+
+    from autoslides.deck import writeDeck
+    from autoslides.sink import openSink
+    from autoslides import profiling
 
-    for child in Document(processedMD).children:
-        if isinstance(child, Heading):
-            currentHead = Head(child)
-            if currentHead.level() < 4:
-                output.write(currentHead.mdSlides())
-        else:
-            output.write(asBlock(child, verbose = args.verbose).mdSlides(head = currentHead))
+    cache = SectionCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache else None
+
+    assets = None
+    if args.assets:
+        from autoslides.assets import AssetStore, DEFAULT_ASSETS_DIR, PILImage
+        if args.max_image_size is not None and PILImage is None:
+            print("--max-image-size needs Pillow, images are copied without downscaling", file = sys.stderr)
+        outputDirectory = os.path.dirname(outputFileName) if outputFileName != "-" else ""
+        assets = AssetStore(os.path.join(outputDirectory, DEFAULT_ASSETS_DIR), sourceDirectory = os.path.dirname(args.source) or ".", maxSize = args.max_image_size)
+
+    highlighter = None
+    if args.highlight:
+        theme = args.highlight_theme or HIGHLIGHT_THEME
+        from autoslides.highlight import Highlighter, HIGHLIGHT_CACHE_DIR, pygments, isTheme
+        if pygments is None:
+            parser.error("--highlight needs pygments")
+        if not isTheme(theme):
+            parser.error(f"--highlight-theme: unknown pygments theme {theme}")
+        highlighter = Highlighter(theme, os.path.join(args.cache_dir, HIGHLIGHT_CACHE_DIR), args.cache_size * 1024 * 1024)
+
+    profiler = profiling.enable() if args.profile or args.trace else None
+
+    options = {"maxBullets": args.max_bullets, "jobs": args.jobs, "stream": args.stream, "verbose": args.verbose, "cache": cache, "paginator": args.paginator, "assets": assets, "highlighter": highlighter,
+               "includeDirectory": os.path.dirname(args.source) or "." if args.allow_includes else None}
+    if args.split:
+        if outputFileName == "-":
+            parser.error("--split needs an output file, the fragments are written next to it")
+        from autoslides.split import writeSplitDeck
+        with open(args.source, "r") as file:
+            writeSplitDeck(outputFileName, file, args.source, splitLevel = args.split_level, **options)
+    else:
+        with open(args.source, "r") as file, openSink(outputFileName, backend = args.backend) as output:
+            writeDeck(output, file, args.source, **options)
+    if assets is not None:
+        assets.close()
 
-    output.write(postamble)
+    if profiler is not None:
+        profiling.disable()
+        if args.profile:
+            print(profiler.report(), file = sys.stderr, end = "")
+        if args.trace:
+            profiler.writeTrace(args.trace)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
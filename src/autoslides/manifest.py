@@ -0,0 +1,89 @@
+from autoslides.table import INCLUDE
+from pathlib import Path
+import hashlib
+import json
+import os
+import re
+
+MANIFEST_NAME = ".autoslides-manifest.json"
+IMAGE_REFERENCE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)")
+REMOTE_SOURCE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:|//")
+
+
+def loadManifest(path:Path) -> dict:
+    """
+    the manifest of the previous build, empty if there was none or it cannot be read
+    """
+    try:
+        manifest = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def saveManifest(path:Path, manifest:dict):
+    temporaryPath = Path(f"{path}.{os.getpid()}.tmp")
+    temporaryPath.write_text(json.dumps(manifest, indent = 1, sort_keys = True))
+    os.replace(temporaryPath, path)
+
+def fileRecord(path:str, previous = None):
+    """
+    the size, modification time and sha256 of a file, None if it does not exist
+    the file is only hashed when its size or modification time differ from the previous record
+    """
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+    if previous is not None and previous["mtime"] == status.st_mtime_ns and previous["size"] == status.st_size:
+        return previous
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return {"mtime": status.st_mtime_ns, "size": status.st_size, "sha256": digest.hexdigest()}
+
+def inputRecords(paths, previous:dict) -> dict:
+    """
+    the records of input files (path -> fileRecord), reusing the previous records of unchanged files
+    """
+    return {str(path): fileRecord(str(path), previous.get(str(path))) for path in paths}
+
+def sameContent(records:dict, previous:dict) -> bool:
+    """
+    whether two sets of input records describe the same files with the same contents
+    """
+    if records.keys() != previous.keys():
+        return False
+    for path, record in records.items():
+        if (record is None) != (previous[path] is None):
+            return False
+        if record is not None and record["sha256"] != previous[path]["sha256"]:
+            return False
+    return True
+
+def referencedFiles(source:Path) -> list:
+    """
+    the local image files a markdown source refers to and the files its csv and tsv fences include
+    """
+    try:
+        text = source.read_text()
+    except OSError:
+        return []
+    files = []
+    for match in IMAGE_REFERENCE.finditer(text):
+        if not REMOTE_SOURCE.match(match.group(1)):
+            files.append(source.parent / match.group(1))
+    files += [source.parent / include for include in INCLUDE.findall(text)]
+    return sorted(set(files))
+
+def includedFiles(paths) -> list:
+    """
+    the files of --include paths, directories are included with every file inside them
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files += sorted(child for child in path.rglob("*") if child.is_file())
+        else:
+            files.append(path)
+    return files
@@ -1,6 +1,7 @@
 import re
-from mistletoe import Document
-from mistletoe.markdown_renderer import MarkdownRenderer,BlankLine, LinkReferenceDefinition
+import itertools
+from autoslides.component import renderedMarkdown, parsedDocument
+from mistletoe.markdown_renderer import BlankLine, LinkReferenceDefinition
 from mistletoe.html_renderer import HTMLRenderer
 from mistletoe.block_token import Paragraph, BlockToken
 
@@ -8,16 +9,13 @@ class ProcessedBlockToken:
     def __init__(self, blockToken:BlockToken):
         self.__blockToken = blockToken
     def processedRender(self):
-        with MarkdownRenderer() as renderer:
-            mdRender = renderer.render(self.__blockToken)
-        return mdRender
+        return renderedMarkdown(self.__blockToken)
 
 class ProcessedParagraph(ProcessedBlockToken):
     def __init__(self, blockToken:BlockToken):
         self.__blockToken = blockToken
     def processedRender(self):
-        with MarkdownRenderer() as renderer:
-            rawParagraph = renderer.render(self.__blockToken)
+        rawParagraph = renderedMarkdown(self.__blockToken)
         rawParagraph = rawParagraph.replace("\n"," ")
         rawParagraph = rawParagraph.replace("$$ ", "$$\n")
         rawParagraph = rawParagraph.replace(" $$", "\n$$")
@@ -26,7 +24,7 @@ class ProcessedParagraph(ProcessedBlockToken):
 
 def preprocess(contents: str) -> str:
     processedContents = ""
-    for child in Document(contents).children:
+    for child in parsedDocument(contents).children:
         if isinstance(child, Paragraph):
             processedContents += f"{ProcessedParagraph(child).processedRender()}\n"
         else:
@@ -34,22 +32,72 @@ def preprocess(contents: str) -> str:
 
     return processedContents
 
-def escapedMathUnderscores(contents: str) -> str:
-    pattern = r"(?<!\$)\$([^$]+)\$(?!\$)"
-    escapedUnderscores = re.sub(pattern, lambda m: m.group(0).replace("_", r"\_"), contents)
-    fixedLinebreaks = re.sub(pattern, lambda m: m.group(0).replace(r"\\", r"\\\\"), escapedUnderscores)
-    return fixedLinebreaks
+INLINE_MATH = re.compile(r"(?<!\$)\$([^$]+)\$(?!\$)")
+FRONTMATTER_FIELD = re.compile(r"([A-Za-z_][\w-]*)\s*:\s*(.*)")
 
-def truncatedFrontmatter(contents: str) -> str:
-    lines = contents.split("\n")
-    trueStart = 0
-    if lines[0] == "---":
-        trueStart = 1
-        i = 1
-        while lines[i] != "---":
-            i += 1
-        if i < len(lines):
-            trueStart = i + 1
-    return "\n".join(lines[trueStart:])
+def escapedMath(match) -> str:
+    """
+    escapes underscores and doubles the latex linebreaks of an inline math match
+    so that they survive the markdown parser
+    """
+    return match.group(0).replace("_", r"\_").replace(r"\\", r"\\\\")
+
+def frontmatterLines(lines, metadata:dict = None):
+    """
+    yields the lines that follow the YAML style frontmatter, a leading "---" without a closing one is not frontmatter
+    the simple "key: value" fields of the frontmatter are stored in metadata (if given)
+    """
+    lines = iter(lines)
+    firstLine = next(lines, None)
+    if firstLine is None:
+        return
+    if firstLine.rstrip("\n") != "---":
+        yield firstLine
+    else:
+        frontmatter = [firstLine]
+        for line in lines:
+            if line.rstrip("\n") == "---":
+                break
+            frontmatter.append(line)
+        else: #no closing fence, the lines are not frontmatter after all
+            yield from frontmatter
+            return
+        for line in frontmatter[1:]:
+            field = FRONTMATTER_FIELD.fullmatch(line.strip())
+            if field and metadata is not None:
+                metadata[field.group(1)] = field.group(2).strip().strip("\"'")
+    yield from lines
+
+def escapedMathLines(lines):
+    """
+    escapes inline math one paragraph at a time (inline math never spans a blank line)
+    and yields the escaped lines
+    """
+    paragraph = []
+    for line in lines:
+        if line.strip() != "":
+            paragraph.append(line)
+            continue
+        if len(paragraph) > 0:
+            yield from INLINE_MATH.sub(escapedMath, "".join(paragraph)).splitlines(keepends = True)
+            paragraph = []
+        yield line
+    if len(paragraph) > 0:
+        yield from INLINE_MATH.sub(escapedMath, "".join(paragraph)).splitlines(keepends = True)
 
+def preprocessedLines(lines, metadata:dict = None):
+    """
+    the preprocessing pipeline, each stage is a generator over lines so the document is never copied as a whole
+    the frontmatter is read right away so its fields are in metadata before any line is consumed
+    """
+    lines = frontmatterLines(lines, metadata)
+    firstLine = next(lines, None)
+    if firstLine is None:
+        return iter([])
+    return escapedMathLines(itertools.chain([firstLine], lines))
 
+def escapedMathUnderscores(contents: str) -> str:
+    return "".join(escapedMathLines(contents.splitlines(keepends = True)))
+
+def truncatedFrontmatter(contents: str) -> str:
+    return "".join(frontmatterLines(contents.splitlines(keepends = True)))
@@ -0,0 +1,94 @@
+from autoslides.args import LINEWIDTH
+import functools
+import re
+import unicodedata
+
+MATH = re.compile(r"\$\$?(.+?)\$\$?")
+TEX_COMMAND = re.compile(r"\\[A-Za-z]+|\\.")
+TEX_LAYOUT = re.compile(r"[{}^_\s]")
+LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+MARKUP = re.compile(r"(?<!\\)(?:\*+|_{2,}|~~|`+|</?[A-Za-z][^>]*>)|(?<=\s)_|^_|_(?=\s|$)")
+ESCAPE = re.compile(r"\\([!-/:-@\[-`{-~])")
+TAB_WIDTH = 4
+MEASURE_CACHE_SIZE = 65536
+
+
+def renderedMath(match) -> str:
+    """
+    approximates the glyphs of inline tex, a command is one glyph and braces, scripts and spaces take no width
+    """
+    tex = match.group(1).replace(r"\_", "_")
+    return TEX_LAYOUT.sub("", TEX_COMMAND.sub("x", tex))
+
+@functools.lru_cache(maxsize = MEASURE_CACHE_SIZE)
+def visibleText(markdown:str) -> str:
+    """
+    the text a line of inline markdown displays: link and image urls, emphasis markers,
+    code backticks, html tags and escapes are removed and inline math is reduced to its glyphs
+    """
+    if "$" in markdown:
+        markdown = MATH.sub(renderedMath, markdown)
+    if "](" in markdown:
+        markdown = LINK.sub(r"\1", markdown)
+    markdown = MARKUP.sub("", markdown)
+    if "\\" in markdown:
+        markdown = ESCAPE.sub(r"\1", markdown)
+    return markdown
+
+def characterWidth(character:str) -> int:
+    if unicodedata.combining(character):
+        return 0
+    return 2 if unicodedata.east_asian_width(character) in ("W", "F") else 1
+
+def displayWidth(text:str) -> int:
+    """
+    the number of terminal style cells text takes, wide east asian characters take two
+    """
+    if text.isascii():
+        return len(text)
+    return sum(map(characterWidth, text))
+
+def wrappedLines(text:str, lineWidth = LINEWIDTH) -> int:
+    """
+    the number of lines a single line of text takes when it is word wrapped at lineWidth cells,
+    leading spaces indent the first line and words wider than a line are broken
+    """
+    if len(text) <= lineWidth and text.isascii():
+        return 1
+    indent = len(text) - len(text.lstrip(" "))
+    lines = 1
+    used = indent
+    first = True
+    for word in text[indent:].split(" "):
+        width = displayWidth(word)
+        if first:
+            first = False
+        elif used + 1 + width <= lineWidth:
+            used += 1 + width
+            continue
+        else:
+            lines += 1
+            used = 0
+        used += width
+        breaks = max(used - 1, 0) // lineWidth
+        lines += breaks
+        used -= breaks * lineWidth
+    return lines
+
+@functools.lru_cache(maxsize = MEASURE_CACHE_SIZE)
+def textHeight(markdown:str, lineWidth = LINEWIDTH) -> int:
+    """
+    the rendered height of inline markdown in lines, every line is word wrapped separately
+    empty text takes no lines
+    """
+    if markdown == "":
+        return 0
+    return sum(wrappedLines(visibleText(line), lineWidth) for line in markdown.split("\n"))
+
+@functools.lru_cache(maxsize = MEASURE_CACHE_SIZE)
+def codeHeight(code:str, lineWidth = LINEWIDTH) -> int:
+    """
+    the height of a line of code, code is displayed as is and breaks at lineWidth cells instead of at words
+    """
+    width = displayWidth(code.expandtabs(TAB_WIDTH))
+    return max(width - 1, 0) // lineWidth + 1 if width > 0 else 0
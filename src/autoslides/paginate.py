@@ -0,0 +1,72 @@
+from autoslides.args import LINES
+
+
+def greedyPagination(heights:list, lines=LINES) -> list:
+    """
+    first fit pagination over precomputed component heights
+    returns the (start, end) index range of the components on each slide,
+    a component taller than lines gets a slide of its own
+    """
+    if len(heights) == 0:
+        return []
+    ranges = []
+    start = 0
+    currentHeight = heights[0]
+    for i in range(1, len(heights)):
+        if currentHeight + heights[i] > lines:
+            ranges.append((start, i))
+            start = i
+            currentHeight = heights[i]
+        else:
+            currentHeight += heights[i]
+    ranges.append((start, len(heights)))
+    return ranges
+
+def balancedPagination(heights:list, lines=LINES) -> list:
+    """
+    optimal fill pagination, uses the fewest slides possible and among those
+    the split with the smallest variance of slide fill (so no one line orphan slides)
+    dynamic programming over the cumulative heights, a slide holds at most lines components
+    of nonzero height so the window is bounded and this runs in O(n * lines)
+    """
+    if len(heights) == 0:
+        return []
+    #zero height components never change a slide's fill, they stay with the component before them
+    #and leading ones with the first component of nonzero height
+    groupStarts = [0]
+    filled = heights[0] > 0
+    for i in range(1, len(heights)):
+        if heights[i] > 0:
+            if filled:
+                groupStarts.append(i)
+            filled = True
+    groupStarts.append(len(heights))
+    cumulative = [0]
+    for g in range(len(groupStarts) - 1):
+        cumulative.append(cumulative[-1] + sum(heights[groupStarts[g]:groupStarts[g + 1]]))
+
+    groupCount = len(groupStarts) - 1
+    best = [(0, 0)] + [None] * groupCount #(slide count, sum of squared fills) of the first i groups
+    previous = [0] * (groupCount + 1)
+    for i in range(1, groupCount + 1):
+        for j in range(i - 1, -1, -1):
+            fill = cumulative[i] - cumulative[j]
+            if fill > lines and j < i - 1:
+                break
+            candidate = (best[j][0] + 1, best[j][1] + fill * fill)
+            if best[i] is None or candidate < best[i]:
+                best[i] = candidate
+                previous[i] = j
+
+    ranges = []
+    i = groupCount
+    while i > 0:
+        ranges.append((groupStarts[previous[i]], groupStarts[i]))
+        i = previous[i]
+    ranges.reverse()
+    return ranges
+
+PAGINATORS = {
+    "greedy": greedyPagination,
+    "balanced": balancedPagination,
+}
@@ -0,0 +1,117 @@
+from contextlib import nullcontext
+import json
+import os
+import sys
+import threading
+import time
+
+NULL_SPAN = nullcontext()
+PROFILER = None #the active Profiler, profiling is off while this is None
+
+
+class Span:
+    """
+    times one region of the conversion and the net change in live memory blocks over it,
+    negative when it frees more blocks than it allocates
+    """
+
+    def __init__(self, profiler:"Profiler", name:str, category:str, args:dict):
+        self.__profiler = profiler
+        self.__name = name
+        self.__category = category
+        self.__args = args
+
+    def tag(self, **args):
+        """
+        adds args known only once the region has run, e.g. the class of the block it built
+        """
+        self.__args.update(args)
+
+    def __enter__(self):
+        self.__blocks = sys.getallocatedblocks()
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        end = time.perf_counter()
+        self.__args["netLiveBlocks"] = sys.getallocatedblocks() - self.__blocks
+        self.__profiler.record(self.__name, self.__category, self.__start, end - self.__start, self.__args)
+
+
+class Profiler:
+    """
+    collects timed spans per stage, per block type and per heading section
+    """
+
+    def __init__(self):
+        self.__origin = time.perf_counter()
+        self.__events = []
+
+    def span(self, name:str, category:str, args:dict) -> Span:
+        return Span(self, name, category, args)
+
+    def record(self, name:str, category:str, start:float, duration:float, args:dict):
+        self.__events.append((name, category, start - self.__origin, duration, args, threading.get_ident()))
+
+    def totals(self, category:str, key = None) -> dict:
+        """
+        total seconds and net live blocks of the events in category, grouped by name or by key(name, args)
+        """
+        totals = {}
+        for name, eventCategory, start, duration, args, thread in self.__events:
+            if eventCategory != category:
+                continue
+            group = name if key is None else key(name, args)
+            seconds, blocks = totals.get(group, (0.0, 0))
+            totals[group] = (seconds + duration, blocks + args["netLiveBlocks"])
+        return totals
+
+    def report(self, top = 10) -> str:
+        report = f"{'stage':28} {'seconds':>11} {'net live blocks':>17}\n"
+        for stage, (seconds, blocks) in self.totals("stage").items():
+            report += f"{stage:28} {seconds:11.4f} {blocks:17}\n"
+        report += f"\n{'block type':28} {'seconds':>11} {'net live blocks':>17}\n"
+        blockTotals = self.totals("stage", lambda name, args: f"{args['block']} {name}" if "block" in args else None)
+        blockTotals.pop(None, None)
+        for block, (seconds, blocks) in sorted(blockTotals.items(), key = lambda total: total[1][0], reverse = True):
+            report += f"{block:28} {seconds:11.4f} {blocks:17}\n"
+        report += "\nslowest sections\n"
+        sections = [event for event in self.__events if event[1] == "section"]
+        for name, category, start, duration, args, thread in sorted(sections, key = lambda event: event[3], reverse = True)[:top]:
+            report += f"{duration:11.4f}s  {name}\n"
+        return report
+
+    def writeTrace(self, path:str):
+        """
+        writes the spans in the Chrome trace event format (chrome://tracing, Perfetto)
+        """
+        events = []
+        for name, category, start, duration, args, thread in self.__events:
+            events.append({"name": name, "cat": category, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6,
+                           "pid": os.getpid(), "tid": thread, "args": args})
+        with open(path, "w") as trace:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace)
+
+
+def enabled() -> bool:
+    """
+    spans are only recorded in this process, work handed to other processes is not profiled
+    """
+    return PROFILER is not None
+
+def enable() -> Profiler:
+    global PROFILER
+    PROFILER = Profiler()
+    return PROFILER
+
+def disable():
+    global PROFILER
+    PROFILER = None
+
+def span(name:str, category = "stage", **args):
+    """
+    a context manager timing the enclosed code, a shared no-op context while profiling is off
+    """
+    if PROFILER is None:
+        return NULL_SPAN
+    return PROFILER.span(name, category, args)
@@ -0,0 +1,110 @@
+from autoslides.block import asBlock, budgetedParagraphs, CompositeBlock, ParagraphBlock, CodeBlock
+from autoslides.head import Head
+from autoslides.args import LINES, LINEWIDTH, PAGINATOR
+from autoslides.sink import OutputSink
+from autoslides.profiling import span
+from autoslides.component import parsedDocument
+from mistletoe.block_token import Heading
+import re
+
+HEADING = re.compile(r"#{1,6}(?:[ \t]|$)")
+FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+REFERENCE_DEFINITION = re.compile(r" {0,3}\[[^\]]+\]:")
+
+
+def isReferenceDefinition(line:str) -> bool:
+    """
+    whether mistletoe reads a line on its own as a link reference definition and nothing else
+    """
+    return REFERENCE_DEFINITION.match(line) is not None and len(parsedDocument(line).children) == 0
+
+def splitSections(lines, definitions:list = None):
+    """
+    splits markdown lines into sections, a new section starts at every ATX heading
+    that is not indented and not inside a code fence or a $$ math block
+    every section except the first one starts with its heading, so sections can be parsed on their own
+    link reference definitions are appended to definitions (if given) since they apply to the whole document,
+    a line that continues a paragraph is never a definition
+    """
+    section = []
+    fence = None
+    insideMathBlock = False
+    insideParagraph = False
+    for line in lines:
+        if insideMathBlock:
+            insideMathBlock = not line.rstrip().endswith("$$")
+        elif fence is None:
+            fenceMatch = FENCE.match(line)
+            if fenceMatch:
+                fence = fenceMatch.group(1)
+            elif line.lstrip().startswith("$$"):
+                mathLine = line.strip()
+                insideMathBlock = len(mathLine) < 4 or not mathLine.endswith("$$")
+            elif HEADING.match(line) and len(section) > 0:
+                yield "".join(section)
+                section = []
+            elif definitions is not None and not insideParagraph and isReferenceDefinition(line):
+                definitions.append(line)
+                section.append(line)
+                continue
+            insideParagraph = fence is None and not insideMathBlock and line.strip() != "" and not HEADING.match(line)
+        elif line.strip().startswith(fence) and line.strip() == fence[0] * len(line.strip()):
+            fence = None
+        section.append(line)
+    if len(section) > 0:
+        yield "".join(section)
+
+def writeSectionSlides(out:OutputSink, source:str, verbose = False, definitions = "", paginator = PAGINATOR, lines = LINES, lineWidth = LINEWIDTH, assets = None, maxBullets = None, highlighter = None, includeDirectory = None):
+    """
+    parses a single section and writes its slides into out
+    the document wide link reference definitions are prepended so that reference links still resolve
+    if an AssetStore is given the images of the section are copied into it before blocks are built
+    with maxBullets the paragraphs of the section keep at most that many sentences in total (see budgetedParagraphs),
+    all blocks of the section are then built before any of them is written
+    with a Highlighter the code blocks are highlighted when they are built
+    csv and tsv fences can only include files if includeDirectory is given (see autoslides.table.includedPath)
+    """
+    if definitions != "":
+        source = f"{definitions}\n{source}"
+    currentHead = None
+    with span("parse"):
+        document = parsedDocument(source)
+    if assets is not None:
+        with span("assets"):
+            assets.rewrite(document)
+    children = document.children
+    children.reverse()
+    del document
+    blocks = []
+    while len(children) > 0:
+        child = children.pop() #blocks keep no tokens, so every token tree is released once its slides are written
+        if isinstance(child, Heading):
+            block = Head(child)
+        else:
+            with span("asBlock") as blockSpan:
+                block = asBlock(child, verbose = verbose, includeDirectory = includeDirectory)
+                if blockSpan is not None:
+                    blockSpan.tag(block = type(block).__name__)
+                if isinstance(block, CompositeBlock):
+                    block.components() #built here so that pagination only measures and splits them
+            if highlighter is not None and isinstance(block, CodeBlock):
+                block.highlight(highlighter)
+        if maxBullets is None:
+            currentHead = writeBlock(out, block, currentHead, paginator, lines, lineWidth)
+        else:
+            blocks.append(block)
+    if maxBullets is not None:
+        budgetedParagraphs([block for block in blocks if isinstance(block, ParagraphBlock)], maxBullets)
+        for block in blocks:
+            currentHead = writeBlock(out, block, currentHead, paginator, lines, lineWidth)
+
+def writeBlock(out:OutputSink, block, currentHead:Head, paginator = PAGINATOR, lines = LINES, lineWidth = LINEWIDTH) -> Head:
+    """
+    writes the slides of a block under the current head, returns the head that applies to the blocks after it
+    """
+    if isinstance(block, Head):
+        if block.level() < 4:
+            block.writeSlides(out)
+        return block
+    block.writeSlides(out, head = currentHead, lines = lines, lineWidth = lineWidth, paginator = paginator)
+    return currentHead
@@ -0,0 +1,102 @@
+from autoslides.api import convert
+from autoslides.deck import templates, TEMPLATES
+from autoslides.cache import SectionCache, DEFAULT_CACHE_SIZE, VERSION
+from autoslides.client import CONVERT_PATH, VERSION_PATH, DEFAULT_PORT_FILE, VERSION_HEADER
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from functools import partial
+from pathlib import Path
+import argparse
+import os
+import signal
+import sys
+
+
+def conversionOptions(query:str) -> dict:
+    """
+    the keyword arguments of convert encoded in a request query string
+    """
+    query = {name: values[-1] for name, values in parse_qs(query).items()}
+    options = {"verbose": query.get("verbose") == "1"}
+    if "lines" in query:
+        options["lines"] = int(query["lines"])
+    if "lineWidth" in query:
+        options["line_width"] = int(query["lineWidth"])
+    if "paginator" in query:
+        options["paginator"] = query["paginator"]
+    if "backend" in query:
+        options["backend"] = query["backend"]
+    if "title" in query:
+        options["title"] = query["title"]
+    return options
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """
+    converts the markdown posted to CONVERT_PATH and responds with the html deck,
+    the conversion options are passed in the query string
+    every response carries the version of the server, the cli asks for it at VERSION_PATH
+    and only forwards to a server of its own version
+    """
+
+    def __init__(self, *args, cache:SectionCache, **kwargs):
+        self.cache = cache
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        if urlsplit(self.path).path != VERSION_PATH:
+            self.sendText(404, "not found")
+            return
+        self.sendText(200, VERSION)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != CONVERT_PATH:
+            self.sendText(404, "not found")
+            return
+        markdown = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        try:
+            deck = convert(markdown, cache = self.cache, **conversionOptions(url.query))
+        except Exception as exception:
+            self.sendText(500, f"{type(exception).__name__}: {exception}")
+            return
+        self.sendText(200, deck, "text/html")
+
+    def sendText(self, status:int, text:str, contentType = "text/plain"):
+        body = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", f"{contentType}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header(VERSION_HEADER, VERSION)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "autoslides serve")
+    parser.add_argument("-p", "--port", type = int, default = 0, help = "localhost port, any free port by default")
+    parser.add_argument("--port-file", type = str, default = DEFAULT_PORT_FILE, help = "file the port is written to, the cli finds the server through it")
+    parser.add_argument("--cache-size", type = int, default = DEFAULT_CACHE_SIZE // (1024 * 1024), help = "section cache size limit in MB")
+    args = parser.parse_args(argv)
+
+    for backend in TEMPLATES:
+        templates(backend) #read once, every request reuses them
+    cache = SectionCache(maxBytes = args.cache_size * 1024 * 1024)
+    server = ThreadingHTTPServer(("localhost", args.port), partial(ConversionHandler, cache = cache))
+    server.daemon_threads = True
+    portFile = Path(args.port_file)
+    portFile.write_text(f"{server.server_address[1]}\n")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0)) #unwinds serve_forever so the port file is removed
+    print(f"serving conversions on http://localhost:{server.server_address[1]}{CONVERT_PATH}", file = sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if portFile.exists() and portFile.read_text().strip() == str(server.server_address[1]):
+            os.remove(portFile)
+    return 0
@@ -0,0 +1,120 @@
+import re
+import sys
+
+DEFAULT_BUFFER_PARTS = 4096
+SLIDE_CLASS = re.compile(r"class:\s*(.*)\n") #the remark slide property used by title slides
+
+
+class OutputSink:
+    """
+    blocks write their rendered slides into an OutputSink instead of concatenating strings
+    parts are collected in a list; if a stream is given they are flushed to it at the end of a slide
+    once bufferParts parts are waiting, otherwise they are kept in memory until getvalue() is called
+    the slides are written as remark.js markdown
+    """
+
+    BACKEND = "remark"
+
+    def __init__(self, stream = None, bufferParts = DEFAULT_BUFFER_PARTS, ownsStream = False):
+        self.__stream = stream
+        self.__bufferParts = bufferParts
+        self.__ownsStream = ownsStream
+        self.__parts = []
+        self.write = self.__parts.append #write is called for every line of every slide
+
+    def endSlide(self, separator:str):
+        """
+        marks the end of a slide, in markdown the slides are separated by separator
+        """
+        self.__parts.append(separator)
+        self.__flushIfFull()
+
+    def writeHtml(self, html:str):
+        """
+        writes html into the markdown of a slide, the remark deck is the content of a textarea
+        which decodes character references once, so they are escaped again
+        """
+        self.write(html.replace("&", "&amp;"))
+
+    def writeRendered(self, text:str):
+        """
+        writes text that is already in the output format (templates, cached slides)
+        """
+        self.__parts.append(text)
+        self.__flushIfFull()
+
+    def __flushIfFull(self):
+        if self.__stream is not None and len(self.__parts) >= self.__bufferParts:
+            self.flush()
+
+    def fork(self) -> "OutputSink":
+        """
+        an in memory sink with the same output format
+        """
+        return type(self)()
+
+    def getvalue(self) -> str:
+        return "".join(self.__parts)
+
+    def flush(self):
+        if self.__stream is None:
+            return
+        self.__stream.write("".join(self.__parts))
+        self.__stream.flush()
+        self.__parts.clear()
+
+    def close(self):
+        self.flush()
+        if self.__ownsStream:
+            self.__stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+
+class HtmlSink(OutputSink):
+    """
+    renders every slide to html when it ends, so the browser does not parse any markdown
+    blocks still write markdown, the parts of the current slide are kept apart until endSlide
+    """
+
+    BACKEND = "html"
+
+    def __init__(self, stream = None, bufferParts = DEFAULT_BUFFER_PARTS, ownsStream = False):
+        from autoslides.component import renderedHtml #keeps mistletoe out of the cli start up
+        super().__init__(stream, bufferParts, ownsStream)
+        self.__renderedHtml = renderedHtml
+        self.__slide = []
+        self.write = self.__slide.append
+
+    def writeHtml(self, html:str):
+        self.write(html)
+
+    def endSlide(self, separator:str):
+        markdown = "".join(self.__slide)
+        self.__slide.clear()
+        classes = ["slide"]
+        slideClass = SLIDE_CLASS.match(markdown)
+        if slideClass:
+            classes += [name.strip() for name in slideClass.group(1).split(",")]
+            markdown = markdown[slideClass.end():]
+        self.writeRendered(f'<section class="{" ".join(classes)}">\n{self.__renderedHtml(markdown)}</section>')
+        super().endSlide("\n")
+
+
+SINKS = {
+    "remark": OutputSink,
+    "html": HtmlSink,
+}
+
+def openSink(path:str, bufferParts = DEFAULT_BUFFER_PARTS, backend = "remark") -> OutputSink:
+    """
+    opens an output file as a sink, the path "-" writes to stdout so the deck can be piped into another process
+    backend is the output format, one of SINKS
+    """
+    if path == "-":
+        return SINKS[backend](sys.stdout, bufferParts)
+    return SINKS[backend](open(path, "w"), bufferParts, ownsStream = True)
@@ -0,0 +1,86 @@
+from autoslides.deck import templates, styledPreamble, layoutOverrides, writeSection, parallelRendering, renderedSections
+from autoslides.mdPreprocess import preprocessedLines
+from autoslides.section import splitSections, HEADING
+from autoslides.sink import HtmlSink, openSink
+from autoslides.profiling import span
+from autoslides.args import LINES, LINEWIDTH, PAGINATOR
+from pathlib import Path
+import json
+import re
+
+SPLIT_LEVEL = 1
+FRAGMENT_NAME = re.compile(r"\d{4}\.html")
+SLIDE_START = '<section class="slide'
+
+
+def headingLevel(section:str):
+    """
+    the level of the heading a section starts with, None for the text before the first heading
+    """
+    heading = HEADING.match(section)
+    if heading is None:
+        return None
+    return len(heading.group(0).rstrip())
+
+def chunkedSections(sections, splitLevel = SPLIT_LEVEL):
+    """
+    groups sections into chunks, a chunk starts at every heading of splitLevel or higher
+    """
+    chunk = []
+    for section in sections:
+        level = headingLevel(section)
+        if level is not None and level <= splitLevel and len(chunk) > 0:
+            yield chunk
+            chunk = []
+        chunk.append(section)
+    if len(chunk) > 0:
+        yield chunk
+
+def fragmentDirectory(output:str) -> Path:
+    output = Path(output)
+    return output.parent / f"{output.stem}-sections"
+
+def writeSplitDeck(output:str, sourceLines, title:str, splitLevel = SPLIT_LEVEL, stream = False, verbose = False, cache = None, paginator = PAGINATOR, lines = LINES, lineWidth = LINEWIDTH, assets = None, jobs = 1, maxBullets = None, highlighter = None, includeDirectory = None) -> int:
+    """
+    writes the deck as html fragments, one per chunk of sections (see chunkedSections),
+    and an index page at output that fetches the fragments as they are needed
+    returns the number of fragments
+    """
+    metadata = {}
+    processedLines = preprocessedLines(sourceLines, metadata)
+    lines, lineWidth = layoutOverrides(metadata, lines, lineWidth)
+    definitions = []
+    sections = splitSections(processedLines, definitions)
+    if not stream:
+        with span("preprocess"):
+            sections = list(sections)
+    directory = fragmentDirectory(output)
+    directory.mkdir(parents = True, exist_ok = True)
+
+    rendered = None
+    if parallelRendering(sections, jobs, stream, assets):
+        options = {"verbose": verbose, "definitions": "".join(definitions), "paginator": paginator, "lines": lines, "lineWidth": lineWidth, "maxBullets": maxBullets, "highlighter": highlighter, "includeDirectory": includeDirectory}
+        rendered = iter(renderedSections(sections, HtmlSink, jobs, cache, **options))
+    chunks = []
+    for number, chunk in enumerate(chunkedSections(sections, splitLevel), start = 1):
+        out = HtmlSink()
+        for section in chunk:
+            if rendered is not None:
+                out.writeRendered(next(rendered))
+            else:
+                writeSection(out, section, verbose, "".join(definitions), cache, paginator, lines, lineWidth, assets, maxBullets, highlighter, includeDirectory)
+        fragment = out.getvalue()
+        name = f"{number:04}.html"
+        (directory / name).write_text(fragment)
+        chunks.append({"url": f"{directory.name}/{name}", "slides": fragment.count(SLIDE_START)})
+
+    written = {Path(chunk["url"]).name for chunk in chunks}
+    for stale in directory.iterdir(): #fragments of an earlier, longer build
+        if FRAGMENT_NAME.fullmatch(stale.name) and stale.name not in written:
+            stale.unlink()
+
+    preamble, postamble = templates("split")
+    with openSink(output, backend = "html") as index:
+        index.writeRendered(styledPreamble(preamble, highlighter).replace("{Title}", metadata.get("title", title)))
+        index.writeRendered(postamble.replace("{Chunks}", json.dumps(chunks)))
+    return len(chunks)
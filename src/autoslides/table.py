@@ -0,0 +1,230 @@
+from autoslides.args import LINEWIDTH
+from autoslides.component import MISTLETOE_LOCK, collapse
+from autoslides.measure import textHeight, displayWidth, visibleText
+from mistletoe.block_token import Table, CodeFence
+from mistletoe.markdown_renderer import MarkdownRenderer
+from pathlib import Path
+import csv
+import os
+import re
+
+DELIMITERS = {"csv": ",", "tsv": "\t"}
+INCLUDE = re.compile(r"^ {0,3}(?:`{3,}|~{3,})[ \t]*(?:csv|tsv)\b[^\n]*?\binclude=(\S+)", re.MULTILINE)
+CELL_SEPARATOR = 3 #the " | " between two cells
+HEADER_OPTIONS = ("repeat", "once")
+
+
+class InvalidFenceException(Exception):
+
+    def __init__(self, message:str):
+        self.message = message
+
+
+def cellHeight(text:str, lineWidth=LINEWIDTH) -> int:
+    """
+    the height of a cell, short ascii cells are always one line and skip the measuring (and its cache)
+    """
+    if text != "" and len(text) <= lineWidth and text.isascii() and "\n" not in text:
+        return 1
+    return textHeight(text, lineWidth)
+
+
+class ColumnarTable:
+    """
+    a table stored column by column, every column is a list of the markdown of its cells
+    cell and row heights are measured once per column (or group of columns) and lineWidth
+    """
+
+    __slots__ = ("__header", "__columns", "__align", "__heights", "__widths")
+
+    def __init__(self, header:list, align:list = None):
+        self.__header = header
+        self.__columns = [[] for _ in header]
+        self.__align = list(align or []) + [None] * (len(header) - len(align or []))
+        self.__heights = {}
+        self.__widths = None
+
+    def append(self, cells:list):
+        """
+        adds a row, missing cells are left empty and cells beyond the header are dropped
+        """
+        for i, column in enumerate(self.__columns):
+            column.append(cells[i] if i < len(cells) else "")
+
+    def rowCount(self) -> int:
+        return len(self.__columns[0]) if len(self.__columns) > 0 else 0
+
+    def columnCount(self) -> int:
+        return len(self.__columns)
+
+    def columnHeights(self, column:int, lineWidth=LINEWIDTH) -> list:
+        key = (column, lineWidth)
+        if key not in self.__heights:
+            self.__heights[key] = [cellHeight(text, lineWidth) for text in self.__columns[column]]
+        return self.__heights[key]
+
+    def rowHeights(self, columns:range, lineWidth=LINEWIDTH) -> list:
+        """
+        the height of every row when only columns are shown, the tallest cell sets the height of a row
+        """
+        key = (columns.start, columns.stop, lineWidth)
+        if key not in self.__heights:
+            heights = [self.columnHeights(column, lineWidth) for column in columns]
+            if len(heights) == 0:
+                self.__heights[key] = [0] * self.rowCount()
+            elif len(heights) == 1:
+                self.__heights[key] = heights[0]
+            else:
+                self.__heights[key] = list(map(max, *heights))
+        return self.__heights[key]
+
+    def headerHeight(self, columns:range, lineWidth=LINEWIDTH) -> int:
+        return max((textHeight(self.__header[column], lineWidth) for column in columns), default = 0)
+
+    def columnWidths(self) -> list:
+        """
+        the display width of the widest cell of every column, header included
+        """
+        if self.__widths is None:
+            self.__widths = [max(map(displayWidth, map(visibleText, [header] + column)))
+                             for header, column in zip(self.__header, self.__columns)]
+        return self.__widths
+
+    def columnGroups(self, columnsPerSlide = None, lineWidth=LINEWIDTH) -> list:
+        """
+        splits the columns into groups that are shown on separate slides,
+        columnsPerSlide is a number of columns, "auto" to fit as many columns as lineWidth allows, or None for a single group
+        """
+        count = self.columnCount()
+        if columnsPerSlide is None or count == 0:
+            return [range(count)]
+        if columnsPerSlide != "auto":
+            return [range(start, min(start + columnsPerSlide, count)) for start in range(0, count, columnsPerSlide)]
+        groups = []
+        start = 0
+        used = 0
+        for column, width in enumerate(self.columnWidths()):
+            if column > start and used + CELL_SEPARATOR + width > lineWidth:
+                groups.append(range(start, column))
+                start = column
+                used = 0
+            used += CELL_SEPARATOR + width
+        groups.append(range(start, count))
+        return groups
+
+    def headerMarkdown(self, columns:range, blank = False) -> str:
+        return self.__cellsMarkdown("" if blank else self.__header[column] for column in columns)
+
+    def alignmentMarkdown(self, columns:range) -> str:
+        alignmentRow = "|" if len(columns) > 0 else ""
+        for column in columns:
+            if self.__align[column] is None:
+                alignmentRow += ":----|"
+            elif self.__align[column] == 0:
+                alignmentRow += ":---:|"
+            else:
+                alignmentRow += "----:|"
+        return alignmentRow
+
+    def rowMarkdown(self, row:int, columns:range) -> str:
+        return self.__cellsMarkdown(self.__columns[column][row] for column in columns)
+
+    def __cellsMarkdown(self, cells) -> str:
+        cumulativeString = ""
+        for cell in cells:
+            cumulativeString += f" {cell} |"
+        return "|" + cumulativeString if cumulativeString != "" else ""
+
+
+def tokenTable(content:Table) -> ColumnarTable:
+    """
+    the columnar form of a markdown table, every cell is collapsed with the same renderer
+    """
+    with MISTLETOE_LOCK, MarkdownRenderer() as renderer:
+        table = ColumnarTable([str(collapse(cell.children, renderer)) for cell in content.header.children], content.column_align)
+        for row in content.children:
+            table.append([str(collapse(cell.children, renderer)) for cell in row.children])
+    return table
+
+def delimitedCell(value:str) -> str:
+    """
+    the markdown of a csv value, pipes are escaped and line breaks become spaces so that the value stays in its cell
+    """
+    return " ".join(value.strip().splitlines()).replace("|", "\\|")
+
+def delimitedTable(lines, delimiter = ",") -> ColumnarTable:
+    """
+    reads csv (or tsv) lines one row at a time into a table, the first row is the header
+    """
+    rows = csv.reader(lines, delimiter = delimiter)
+    table = ColumnarTable([delimitedCell(cell) for cell in next(rows, [])])
+    for row in rows:
+        if len(row) > 0:
+            table.append([delimitedCell(cell) for cell in row])
+    return table
+
+def fenceOptions(fence:CodeFence) -> dict:
+    """
+    the key=value options after the language of a fence, e.g. ```csv include=data.csv header=once columns=auto
+    """
+    options = {}
+    for option in fence.info_string.split()[1:]:
+        key, _, value = option.partition("=")
+        options[key] = value
+    return options
+
+def fenceLayout(fence:CodeFence) -> tuple:
+    """
+    whether the header is repeated on every slide and the columnsPerSlide of a table fence (see ColumnarTable.columnGroups)
+    """
+    options = fenceOptions(fence)
+    header = options.get("header", "repeat")
+    if header not in HEADER_OPTIONS:
+        raise InvalidFenceException(f"header={header} is not one of {', '.join(HEADER_OPTIONS)}")
+    columns = options.get("columns")
+    if columns is None or columns == "auto":
+        return header == "repeat", columns
+    if not columns.isdigit() or int(columns) == 0:
+        raise InvalidFenceException(f"columns={columns} is not a positive number or auto")
+    return header == "repeat", int(columns)
+
+def includedPath(include:str, includeDirectory) -> Path:
+    """
+    the file an include option names, relative paths are resolved against includeDirectory
+    includes are refused if includeDirectory is None and when they point outside of it
+    """
+    if includeDirectory is None:
+        raise InvalidFenceException("include= files are not allowed")
+    directory = Path(includeDirectory).resolve()
+    path = (directory / include).resolve()
+    if not path.is_relative_to(directory):
+        raise InvalidFenceException(f"include={include} is outside of {directory}")
+    return path
+
+def fencedTable(fence:CodeFence, includeDirectory = None) -> ColumnarTable:
+    """
+    the table of a csv or tsv fence, read from the file named by its include option if it has one (see includedPath)
+    """
+    delimiter = DELIMITERS[fence.language]
+    include = fenceOptions(fence).get("include")
+    if include is not None:
+        with open(includedPath(include, includeDirectory), newline = "") as file:
+            return delimitedTable(file, delimiter)
+    return delimitedTable(fence.children[0].content.splitlines(keepends = True), delimiter)
+
+def includeStamps(section:str, includeDirectory = None) -> tuple:
+    """
+    the size and modification time of the files the table fences of a section include,
+    a section whose included files changed is rendered again instead of being taken from the cache
+    """
+    if includeDirectory is None or "include=" not in section:
+        return ()
+    stamps = []
+    for include in INCLUDE.findall(section):
+        try:
+            path = includedPath(include, includeDirectory)
+            status = os.stat(path)
+            stamps.append((str(path), status.st_mtime_ns, status.st_size))
+        except (InvalidFenceException, OSError):
+            stamps.append((include, None, None))
+    return tuple(stamps)
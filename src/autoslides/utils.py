@@ -1,9 +1,8 @@
 from mistletoe.block_token import Paragraph, Heading, List, ListItem, BlockToken, CodeFence, Quote, Table, TableRow, TableCell
 from mistletoe.span_token import RawText, Emphasis, Strong, SpanToken, EscapeSequence
-from autoslides.args import LINEWIDTH
+from autoslides.args import LINEWIDTH, MULTILINE_ENVIRONMENTS
 from autoslides.component import collapse
 import re
-from string import Template
 
 
 class SentenceDelimiter(SpanToken):
@@ -11,39 +10,54 @@ class SentenceDelimiter(SpanToken):
     def __init__(self):
         self.content = ''
 
-def extractedMathEnvironments(mathBlock, environment) -> dict:
+TEX_SCANNER = re.compile(r'\\\\|\\begin\{([^}]*)\}|\\end\{([^}]*)\}|\\.|[{}]', re.DOTALL)
+
+def splitTexLines(tex:str, environments = MULTILINE_ENVIRONMENTS) -> list:
     '''
-    this function extracts multiline math environments (e.g. matrix, bmatrix) so that the MathBlock.__init__() can safely split math blocks by newlines 
-    it does not support nested multiline environments e.g. matrix inside a matrix
+    this function splits TeX source at its top level line breaks (\\\\) in a single pass
+    line breaks inside braces or inside one of the multiline environments (e.g. matrix, cases) are kept,
+    environments can be nested
     '''
-    pattern = Template(r'\\begin{$env}.*?\\end{$env}')
-    multilinePattern = re.compile(pattern.substitute(env=environment))
-    multilineBlocks = multilinePattern.findall(mathBlock)
-    replacedMathBlock = re.sub(multilinePattern, f'$${environment}$$', mathBlock)
-    return {'extractedBlocks':multilineBlocks, 'replacedMathBlock':replacedMathBlock}
+    lines = []
+    lineStart = 0
+    braceDepth = 0
+    environmentDepth = 0
+    for match in TEX_SCANNER.finditer(tex):
+        token = match.group()
+        if token == '\\\\':
+            if braceDepth == 0 and environmentDepth == 0:
+                lines.append(tex[lineStart:match.start()])
+                lineStart = match.end()
+        elif match.group(1) is not None:
+            if match.group(1) in environments:
+                environmentDepth += 1
+        elif match.group(2) is not None:
+            if match.group(2) in environments and environmentDepth > 0:
+                environmentDepth -= 1
+        elif token == '{':
+            braceDepth += 1
+        elif token == '}' and braceDepth > 0:
+            braceDepth -= 1
+    lines.append(tex[lineStart:])
+    return lines
 
+SENTENCE_SCANNER = re.compile(r'\$.*?\$|\. ')
 
 def delimitedTextToken(textToken:RawText) -> list:
     '''
     this function takes a RawText span token and splits it into multiple RawText tokens with SentenceDelimiters in between
     the delimiter is the string '. '
-    this function will not split inline math pharases
+    this function will not split inline math pharases, they are matched (and skipped over) as a whole in the same scan
     '''
-    pattern = re.compile(r'\$.*?\$')
-    inlineMathParts = re.findall(pattern, textToken.content)
-    rawTextContent = pattern.sub('$inlineMath$', textToken.content)
+    content = textToken.content
     cumulativeTokenList = []
-    tokens = rawTextContent.split('. ')
-    for token in tokens[:-1]:
-        cumulativeTokenList += [RawText(f'{token}.'), SentenceDelimiter()]
-    if tokens[-1] != '':
-        cumulativeTokenList.append(RawText(tokens[-1]))
-    i = 0
-    while i < len(inlineMathParts):
-        for token in cumulativeTokenList:
-            for j in range(token.content.count('$inlineMath$')):
-                token.content = token.content.replace('$inlineMath$', inlineMathParts[i] ,1)
-                i += 1
+    sentenceStart = 0
+    for match in SENTENCE_SCANNER.finditer(content):
+        if match.group() == '. ':
+            cumulativeTokenList += [RawText(content[sentenceStart:match.start() + 1]), SentenceDelimiter()]
+            sentenceStart = match.end()
+    if sentenceStart < len(content):
+        cumulativeTokenList.append(RawText(content[sentenceStart:]))
     return cumulativeTokenList
 
 def rawTex(mathParagraph):
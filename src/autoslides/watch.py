@@ -0,0 +1,150 @@
+from autoslides.deck import writeDeck
+from autoslides.sink import openSink
+from autoslides.cache import SectionCache
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from functools import partial
+from pathlib import Path
+import argparse
+import os
+import sys
+import threading
+import time
+
+EVENTS_PATH = "/__autoslides/events"
+RELOAD_SCRIPT = f"""<script>
+            new EventSource("{EVENTS_PATH}").onmessage = function () {{ location.reload(); }};
+        </script>
+"""
+
+
+class Reloader:
+    """
+    counts rebuilds and wakes up the preview connections waiting for the next one
+    """
+
+    def __init__(self):
+        self.__version = 0
+        self.__condition = threading.Condition()
+
+    def notify(self):
+        with self.__condition:
+            self.__version += 1
+            self.__condition.notify_all()
+
+    def wait(self, version:int, timeout:float) -> int:
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__version != version, timeout)
+            return self.__version
+
+    def version(self) -> int:
+        return self.__version
+
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """
+    serves the output directory, the deck gets a live reload script injected
+    the slide index survives reloads since remark.js keeps it in the url fragment
+    """
+
+    def __init__(self, *args, deckName:str, reloader:Reloader, **kwargs):
+        self.deckName = deckName
+        self.reloader = reloader
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == EVENTS_PATH:
+            self.sendEvents()
+        elif path in ("/", f"/{self.deckName}"):
+            self.sendDeck()
+        else:
+            super().do_GET()
+
+    def sendDeck(self):
+        deck = (Path(self.directory) / self.deckName).read_text()
+        body = deck.replace("</body>", f"{RELOAD_SCRIPT}</body>", 1).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def sendEvents(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        version = self.reloader.version()
+        try:
+            while True:
+                newVersion = self.reloader.wait(version, timeout = 15)
+                if newVersion != version:
+                    self.wfile.write(b"data: reload\n\n")
+                    version = newVersion
+                else:
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def modificationStamp(path:str):
+    try:
+        status = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return status.st_mtime_ns, status.st_size
+
+def rebuild(source:str, output:str, verbose:bool, cache:SectionCache) -> float:
+    """
+    renders the deck again, only the sections that changed since the last build are parsed
+    """
+    start = time.perf_counter()
+    with open(source, "r") as file, openSink(output) as outputSink:
+        writeDeck(outputSink, file, source, verbose = verbose, cache = cache)
+    return time.perf_counter() - start
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "autoslides watch")
+    parser.add_argument("source", type = str, help = "markdown source file path")
+    parser.add_argument("output", type = str, nargs = "?", help = "html output file path")
+    parser.add_argument("-v", "--verbose", action = "store_true", help = "enable complete paragraph rendering")
+    parser.add_argument("-p", "--port", type = int, default = 8000, help = "preview server port")
+    parser.add_argument("--interval", type = float, default = 0.1, help = "seconds between source checks")
+    parser.add_argument("--no-serve", action = "store_true", help = "only rebuild, do not start the preview server")
+    args = parser.parse_args(argv)
+
+    output = args.output if args.output is not None else f"{os.path.splitext(args.source)[0]}.html"
+    cache = SectionCache() #in memory, unchanged sections are reused between rebuilds
+    reloader = Reloader()
+    rebuild(args.source, output, args.verbose, cache)
+
+    if not args.no_serve:
+        outputPath = Path(output).resolve()
+        handler = partial(PreviewHandler, deckName = outputPath.name, reloader = reloader, directory = str(outputPath.parent))
+        server = ThreadingHTTPServer(("localhost", args.port), handler)
+        server.daemon_threads = True
+        threading.Thread(target = server.serve_forever, daemon = True).start()
+        print(f"serving http://localhost:{server.server_address[1]}/{outputPath.name}")
+
+    stamp = modificationStamp(args.source)
+    try:
+        while True:
+            time.sleep(args.interval)
+            newStamp = modificationStamp(args.source)
+            if newStamp == stamp or newStamp is None:
+                continue
+            stamp = newStamp
+            try:
+                seconds = rebuild(args.source, output, args.verbose, cache)
+            except Exception as exception:
+                print(f"{args.source}: {type(exception).__name__}: {exception}", file = sys.stderr)
+                continue
+            reloader.notify()
+            print(f"rebuilt {output} in {seconds * 1000:.0f}ms")
+    except KeyboardInterrupt:
+        return 0